@@ -0,0 +1,5 @@
+import os
+
+# Textual reads this once when ``textual.constants`` is imported, so it must be set
+# before any test module pulls Textual in. Headless tests never need animations.
+os.environ.setdefault("TEXTUAL_ANIMATIONS", "none")
@@ -1,8 +1,11 @@
 import json
 from unittest.mock import patch
 
+import pytest
+
 from tuiredis.config import (
     ConnectionProfile,
+    batched_writes,
     delete_connection,
     get_config_dir,
     get_connections_file,
@@ -11,185 +14,218 @@ from tuiredis.config import (
 )
 
 
-def test_get_config_dir_creates_dir(tmp_path):
-    with patch("tuiredis.config.Path.home", return_value=tmp_path):
-        config_dir = get_config_dir()
-        assert config_dir == tmp_path / ".tuiredis"
-        assert config_dir.exists()
-
-
-def test_load_connections_empty(tmp_path):
-    with patch("tuiredis.config.Path.home", return_value=tmp_path):
-        assert load_connections() == []
-
-
-def test_save_connection_new(tmp_path):
-    with patch("tuiredis.config.Path.home", return_value=tmp_path):
-        profile: ConnectionProfile = {
-            "name": "Test DB",
-            "host": "localhost",
-            "port": 6379,
-            "db": 0,
-        }
-        saved_profile, connections, persisted = save_connection(profile)
-
-        assert persisted is True
-        assert len(connections) == 1
-        assert connections[0]["name"] == "Test DB"
-        assert "id" in connections[0]  # ID must be generated
-        assert saved_profile["id"] == connections[0]["id"]
-
-        # Verify written file
-        file_path = get_connections_file()
-        assert file_path.exists()
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            assert data[0]["name"] == "Test DB"
-            assert data[0]["id"] == connections[0]["id"]
-
-
-def test_save_connection_update(tmp_path):
-    with patch("tuiredis.config.Path.home", return_value=tmp_path):
-        profile: ConnectionProfile = {
-            "name": "DB 1",
-            "host": "localhost",
-            "port": 6379,
-            "db": 0,
-        }
-        saved1, conns1, persisted1 = save_connection(profile)
-        assert persisted1 is True
-        conn_id = saved1["id"]
-
-        # Update name
-        profile_update = dict(conns1[0])
-        profile_update["name"] = "DB 1 Updated"
-        profile_update["port"] = 6380
-
-        saved2, conns2, persisted2 = save_connection(profile_update)  # type: ignore
-
-        assert persisted2 is True
-        assert len(conns2) == 1
-        assert conns2[0]["id"] == conn_id
-        assert conns2[0]["name"] == "DB 1 Updated"
-        assert conns2[0]["port"] == 6380
-
-
-def test_save_multiple_connections(tmp_path):
-    with patch("tuiredis.config.Path.home", return_value=tmp_path):
-        p1 = {"host": "h1", "port": 1}
-        p2 = {"host": "h2", "port": 2}
+@pytest.fixture(autouse=True)
+def _fake_home(tmp_path, monkeypatch):
+    """Point the config directory at a per-test temporary home."""
+    monkeypatch.setattr("tuiredis.config.Path.home", lambda: tmp_path)
 
+
+def test_get_config_dir_creates_dir(tmp_path):
+    config_dir = get_config_dir()
+    assert config_dir == tmp_path / ".tuiredis"
+    assert config_dir.exists()
+
+
+def test_load_connections_empty():
+    assert load_connections() == []
+
+
+def test_save_connection_new():
+    profile: ConnectionProfile = {
+        "name": "Test DB",
+        "host": "localhost",
+        "port": 6379,
+        "db": 0,
+    }
+    saved_profile, connections, persisted = save_connection(profile)
+
+    assert persisted is True
+    assert len(connections) == 1
+    assert connections[0]["name"] == "Test DB"
+    assert "id" in connections[0]  # ID must be generated
+    assert saved_profile["id"] == connections[0]["id"]
+
+    # Verify written file
+    file_path = get_connections_file()
+    assert file_path.exists()
+    data = json.loads(file_path.read_bytes())
+    assert data[0]["name"] == "Test DB"
+    assert data[0]["id"] == connections[0]["id"]
+
+
+def test_save_connection_update():
+    profile: ConnectionProfile = {
+        "name": "DB 1",
+        "host": "localhost",
+        "port": 6379,
+        "db": 0,
+    }
+    saved1, conns1, persisted1 = save_connection(profile)
+    assert persisted1 is True
+    conn_id = saved1["id"]
+
+    # Update name
+    profile_update = dict(conns1[0])
+    profile_update["name"] = "DB 1 Updated"
+    profile_update["port"] = 6380
+
+    saved2, conns2, persisted2 = save_connection(profile_update)  # type: ignore
+
+    assert persisted2 is True
+    assert len(conns2) == 1
+    assert conns2[0]["id"] == conn_id
+    assert conns2[0]["name"] == "DB 1 Updated"
+    assert conns2[0]["port"] == 6380
+
+
+def test_save_multiple_connections():
+    p1 = {"host": "h1", "port": 1}
+    p2 = {"host": "h2", "port": 2}
+
+    with batched_writes():
         _, _, persisted1 = save_connection(p1)  # type: ignore
         _, connections, persisted2 = save_connection(p2)  # type: ignore
 
-        assert persisted1 is True
-        assert persisted2 is True
-        assert len(connections) == 2
-        assert connections[0]["host"] == "h1"
-        assert connections[1]["host"] == "h2"
-        # Names should be generated since none were provided
-        assert connections[0]["name"] == "h1:1"
-        assert connections[1]["name"] == "h2:2"
+    assert persisted1 is True
+    assert persisted2 is True
+    assert len(connections) == 2
+    assert connections[0]["host"] == "h1"
+    assert connections[1]["host"] == "h2"
+    # Names should be generated since none were provided
+    assert connections[0]["name"] == "h1:1"
+    assert connections[1]["name"] == "h2:2"
 
 
-def test_delete_connection(tmp_path):
-    with patch("tuiredis.config.Path.home", return_value=tmp_path):
+def test_delete_connection():
+    with batched_writes():
         _, _, persisted1 = save_connection({"name": "c1", "host": "h1", "port": 1})  # type: ignore
         saved2, _, persisted2 = save_connection({"name": "c2", "host": "h2", "port": 2})  # type: ignore
 
-        assert persisted1 is True
-        assert persisted2 is True
-        id_to_delete = saved2["id"]
+    assert persisted1 is True
+    assert persisted2 is True
+    id_to_delete = saved2["id"]
+
+    after_del, persisted = delete_connection(id_to_delete)
+    assert persisted is True
+    assert len(after_del) == 1
+    assert after_del[0]["name"] == "c1"
+
+
+def test_batched_writes_writes_file_once():
+    """Saves inside batched_writes hit the disk a single time, on exit."""
+    with patch("tuiredis.config._write_connections", return_value=True) as write:
+        with batched_writes():
+            save_connection({"name": "c1", "host": "h1", "port": 1})  # type: ignore
+            save_connection({"name": "c2", "host": "h2", "port": 2})  # type: ignore
+            assert write.call_count == 0
+    assert write.call_count == 1
+    assert [c["name"] for c in write.call_args.args[0]] == ["c1", "c2"]
+
 
-        after_del, persisted = delete_connection(id_to_delete)
-        assert persisted is True
-        assert len(after_del) == 1
-        assert after_del[0]["name"] == "c1"
+def test_save_connection_unchanged_skips_rewrite():
+    """Saving an identical profile again leaves the file untouched."""
+    saved, _, _ = save_connection({"name": "c1", "host": "h1", "port": 1})  # type: ignore
+    with patch("tuiredis.config.os.replace") as replace:
+        _, _, persisted = save_connection(dict(saved))  # type: ignore
+    assert persisted is True
+    replace.assert_not_called()
 
 
-def test_load_connections_invalid_json(tmp_path):
+def test_load_connections_reuses_parse_until_file_changes():
+    """An unchanged file is not parsed again; an external edit is picked up."""
+    save_connection({"name": "c1", "host": "h1", "port": 1})  # type: ignore
+    with patch("tuiredis.config._loads") as loads:
+        first = load_connections()
+        first.clear()  # callers get their own list
+        assert [c["name"] for c in load_connections()] == ["c1"]
+    loads.assert_not_called()
+
+    get_connections_file().write_text('[{"id": "x", "name": "edited"}]', encoding="utf-8")
+    assert [c["name"] for c in load_connections()] == ["edited"]
+
+
+def test_round_trip_without_orjson(monkeypatch):
+    """The stdlib json fallback is used when orjson is not installed."""
+    monkeypatch.setattr("tuiredis.config.orjson", None)
+    save_connection({"name": "c1", "host": "h1", "port": 1})  # type: ignore
+    assert [c["name"] for c in load_connections()] == ["c1"]
+
+
+def test_load_connections_invalid_json():
     """load_connections should return [] when file contains invalid JSON."""
-    with patch("tuiredis.config.Path.home", return_value=tmp_path):
-        cfg_file = get_connections_file()
-        cfg_file.parent.mkdir(parents=True, exist_ok=True)
-        cfg_file.write_text("not valid json", encoding="utf-8")
-        assert load_connections() == []
+    cfg_file = get_connections_file()
+    cfg_file.parent.mkdir(parents=True, exist_ok=True)
+    cfg_file.write_text("not valid json", encoding="utf-8")
+    assert load_connections() == []
 
 
-def test_load_connections_non_list_json(tmp_path):
+def test_load_connections_non_list_json():
     """load_connections should return [] when file contains valid JSON but not a list."""
-    with patch("tuiredis.config.Path.home", return_value=tmp_path):
-        cfg_file = get_connections_file()
-        cfg_file.parent.mkdir(parents=True, exist_ok=True)
-        cfg_file.write_text('{"key": "value"}', encoding="utf-8")
-        assert load_connections() == []
+    cfg_file = get_connections_file()
+    cfg_file.parent.mkdir(parents=True, exist_ok=True)
+    cfg_file.write_text('{"key": "value"}', encoding="utf-8")
+    assert load_connections() == []
 
 
-def test_save_connection_deduplication(tmp_path):
+def test_save_connection_deduplication():
     """Saving a connection with the same host/port/db should update, not duplicate."""
-    with patch("tuiredis.config.Path.home", return_value=tmp_path):
-        p1 = {"host": "localhost", "port": 6379, "db": 0}
-        saved1, _, persisted1 = save_connection(p1)  # type: ignore
-        assert persisted1 is True
-        conn_id = saved1["id"]
-
-        # Second save — same details, no ID passed → should find and reuse the ID
-        p2 = {"host": "localhost", "port": 6379, "db": 0, "name": "Updated"}
-        saved2, conns, persisted2 = save_connection(p2)  # type: ignore
-        assert persisted2 is True
-        assert len(conns) == 1
-        assert saved2["id"] == conn_id
-        assert conns[0]["name"] == "Updated"
+    p1 = {"host": "localhost", "port": 6379, "db": 0}
+    saved1, _, persisted1 = save_connection(p1)  # type: ignore
+    assert persisted1 is True
+    conn_id = saved1["id"]
 
+    # Second save — same details, no ID passed → should find and reuse the ID
+    p2 = {"host": "localhost", "port": 6379, "db": 0, "name": "Updated"}
+    saved2, conns, persisted2 = save_connection(p2)  # type: ignore
+    assert persisted2 is True
+    assert len(conns) == 1
+    assert saved2["id"] == conn_id
+    assert conns[0]["name"] == "Updated"
 
-def test_save_connection_different_passwords_do_not_deduplicate(tmp_path):
-    with patch("tuiredis.config.Path.home", return_value=tmp_path):
-        _, _, persisted1 = save_connection({"host": "localhost", "port": 6379, "db": 0, "password": "a"})  # type: ignore
-        _, conns, persisted2 = save_connection({"host": "localhost", "port": 6379, "db": 0, "password": "b"})  # type: ignore
 
-        assert persisted1 is True
-        assert persisted2 is True
-        assert len(conns) == 2
+def test_save_connection_different_passwords_do_not_deduplicate():
+    _, _, persisted1 = save_connection({"host": "localhost", "port": 6379, "db": 0, "password": "a"})  # type: ignore
+    _, conns, persisted2 = save_connection({"host": "localhost", "port": 6379, "db": 0, "password": "b"})  # type: ignore
 
+    assert persisted1 is True
+    assert persisted2 is True
+    assert len(conns) == 2
 
-def test_save_connection_write_failure(tmp_path):
+
+def test_save_connection_write_failure():
     """save_connection should report persistence failure without raising."""
-    with patch("tuiredis.config.Path.home", return_value=tmp_path):
-        with patch("pathlib.Path.open", side_effect=OSError("disk full")):
-            profile, conns, persisted = save_connection({"name": "X", "host": "h", "port": 1})  # type: ignore
-            assert profile.get("name") == "X"
-            assert len(conns) == 1
-            assert persisted is False
-            assert not get_connections_file().exists()
+    with patch("pathlib.Path.open", side_effect=OSError("disk full")):
+        profile, conns, persisted = save_connection({"name": "X", "host": "h", "port": 1})  # type: ignore
+        assert profile.get("name") == "X"
+        assert len(conns) == 1
+        assert persisted is False
+        assert not get_connections_file().exists()
 
 
-def test_delete_connection_nonexistent_id(tmp_path):
+def test_delete_connection_nonexistent_id():
     """delete_connection with an unknown ID should be a no-op (list unchanged)."""
-    with patch("tuiredis.config.Path.home", return_value=tmp_path):
-        _, _, persisted1 = save_connection({"name": "keep", "host": "h1", "port": 1})  # type: ignore
-        assert persisted1 is True
-        result, persisted2 = delete_connection("does-not-exist")
-        assert persisted2 is True
-        assert len(result) == 1
-        assert result[0]["name"] == "keep"
+    _, _, persisted1 = save_connection({"name": "keep", "host": "h1", "port": 1})  # type: ignore
+    assert persisted1 is True
+    result, persisted2 = delete_connection("does-not-exist")
+    assert persisted2 is True
+    assert len(result) == 1
+    assert result[0]["name"] == "keep"
 
 
-def test_delete_connection_write_failure(tmp_path):
+def test_delete_connection_write_failure():
     """delete_connection should report persistence failure without raising."""
-    with patch("tuiredis.config.Path.home", return_value=tmp_path):
-        saved, _, persisted1 = save_connection({"name": "keep", "host": "h1", "port": 1})  # type: ignore
-        assert persisted1 is True
-        with patch("pathlib.Path.open", side_effect=OSError("disk full")):
-            result, persisted2 = delete_connection(saved["id"])
-        assert persisted2 is False
-        assert result == []
-        assert load_connections()[0]["id"] == saved["id"]
+    saved, _, persisted1 = save_connection({"name": "keep", "host": "h1", "port": 1})  # type: ignore
+    assert persisted1 is True
+    with patch("pathlib.Path.open", side_effect=OSError("disk full")):
+        result, persisted2 = delete_connection(saved["id"])
+    assert persisted2 is False
+    assert result == []
+    assert load_connections()[0]["id"] == saved["id"]
 
 
 def test_get_config_dir_mkdir_failure(tmp_path):
     """get_config_dir should not raise even if mkdir fails."""
-    with patch("tuiredis.config.Path.home", return_value=tmp_path):
-        with patch("pathlib.Path.mkdir", side_effect=OSError("permission denied")):
-            # Should not raise
-            result = get_config_dir()
-            assert result == tmp_path / ".tuiredis"
+    with patch("pathlib.Path.mkdir", side_effect=OSError("permission denied")):
+        # Should not raise
+        result = get_config_dir()
+        assert result == tmp_path / ".tuiredis"
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from textual.widgets import Button, Input, Static
@@ -12,23 +12,26 @@ from tuiredis.screens.connect import ConnectScreen
 def mock_redis_client():
     from tuiredis.redis_client import RedisClient
 
-    with patch.object(RedisClient, "connect", return_value=(True, "")):
-        with patch.object(RedisClient, "get_server_info", return_value={"redis_version": "7.0.0"}):
-            with patch.object(RedisClient, "scan_keys_paginated", return_value=(0, [])):
-                with patch.object(RedisClient, "get_keyspace_info", return_value={0: 10, 1: 5}):
-                    with patch.object(RedisClient, "get_types", return_value={}):
-                        with (
-                            patch("tuiredis.screens.connect.load_connections", return_value=[]),
-                            patch(
-                                "tuiredis.screens.connect.save_connection",
-                                return_value=(
-                                    {"id": "test-id", "host": "127.0.0.1", "port": 6379, "db": 0},
-                                    [],
-                                    True,
-                                ),
-                            ),
-                        ):
-                            yield
+    with (
+        patch.multiple(
+            RedisClient,
+            connect=MagicMock(return_value=(True, "")),
+            get_server_info=MagicMock(return_value={"redis_version": "7.0.0"}),
+            scan_keys_paginated=MagicMock(return_value=(0, [], {})),
+            get_keyspace_info=MagicMock(return_value={0: 10, 1: 5}),
+            get_types=MagicMock(return_value={}),
+        ),
+        patch("tuiredis.screens.connect.load_connections", return_value=[]),
+        patch(
+            "tuiredis.screens.connect.save_connection",
+            return_value=(
+                {"id": "test-id", "host": "127.0.0.1", "port": 6379, "db": 0},
+                [],
+                True,
+            ),
+        ),
+    ):
+        yield
 
 
 @pytest.mark.asyncio
@@ -49,7 +52,7 @@ async def test_connect_screen(mock_redis_client):
         # Simulate connecting
         connect_btn = app.screen.query_one("#connect-btn", Button)
         await pilot.click(connect_btn)
-        await pilot.pause(0.1)
+        await pilot.pause()
 
         # Should transition out of ConnectScreen to MainScreen
         if isinstance(app.screen, ConnectScreen):
@@ -85,7 +88,7 @@ async def test_connect_existing_profile_refreshes_history_after_successful_conne
     with (
         patch.object(RedisClient, "connect", return_value=(True, "")),
         patch.object(RedisClient, "get_server_info", return_value={"redis_version": "7.0.0"}),
-        patch.object(RedisClient, "scan_keys_paginated", return_value=(0, [])),
+        patch.object(RedisClient, "scan_keys_paginated", return_value=(0, [], {})),
         patch.object(RedisClient, "get_keyspace_info", return_value={0: 10, 1: 5}),
         patch.object(RedisClient, "get_types", return_value={}),
         patch("tuiredis.screens.connect.load_connections", return_value=[]),
@@ -107,12 +110,152 @@ async def test_connect_existing_profile_refreshes_history_after_successful_conne
 
             connect_btn = connect_screen.query_one("#connect-btn", Button)
             await pilot.click(connect_btn)
-            await pilot.pause(0.1)
+            await pilot.pause()
 
             refresh_history.assert_awaited()
             assert connect_screen.current_profile_id == "existing-id"
 
 
+async def test_save_refreshes_history_from_returned_profiles():
+    saved = {"id": "p1", "name": "Local", "host": "127.0.0.1", "port": 6379, "db": 0}
+    with (
+        patch("tuiredis.screens.connect.load_connections", return_value=[]) as load,
+        patch("tuiredis.screens.connect.save_connection", return_value=(saved, [saved], True)),
+    ):
+        app = TRedisApp()
+        async with app.run_test(size=(120, 80)) as pilot:
+            screen = app.screen
+            await screen._do_save()
+            await pilot.pause()
+
+            assert screen.current_profile_id == "p1"
+            assert list(screen.profiles) == ["p1"]
+            load.assert_called_once()  # only the initial mount reads the file
+
+
+async def test_connect_after_save_skips_second_write(mock_redis_client):
+    def fake_save(profile):
+        saved = {**profile, "id": "p1", "name": profile["name"] or "127.0.0.1:6379"}
+        return saved, [saved], True
+
+    with patch("tuiredis.screens.connect.save_connection", side_effect=fake_save) as save:
+        app = TRedisApp()
+        async with app.run_test(size=(120, 80)) as pilot:
+            screen = app.screen
+            await screen._do_save()
+            await screen._do_connect()
+            await pilot.pause()
+
+            save.assert_called_once()
+            assert not isinstance(app.screen, ConnectScreen)
+
+
+async def test_connect_opens_main_screen_before_auto_save_finishes(mock_redis_client):
+    import asyncio
+    import threading
+
+    release = threading.Event()
+
+    def slow_save(profile):
+        release.wait(5)
+        saved = {**profile, "id": "p1"}
+        return saved, [saved], True
+
+    with patch("tuiredis.screens.connect.save_connection", side_effect=slow_save):
+        app = TRedisApp()
+        async with app.run_test(size=(120, 80)) as pilot:
+            screen = app.screen
+            connecting = asyncio.create_task(screen._do_connect())
+            for _ in range(50):
+                await pilot.pause(0.02)
+                if not isinstance(app.screen, ConnectScreen):
+                    break
+
+            assert not isinstance(app.screen, ConnectScreen)
+            assert not connecting.done()
+
+            release.set()
+            await connecting
+            assert screen.current_profile_id == "p1"
+
+
+async def test_double_click_history_connects_without_refilling_form():
+    from types import SimpleNamespace
+
+    profile = {"id": "p1", "name": "Local", "host": "10.0.0.1", "port": 6380, "db": 0}
+    with (
+        patch("tuiredis.screens.connect.load_connections", return_value=[profile]),
+        patch.object(ConnectScreen, "_do_connect", new_callable=AsyncMock) as do_connect,
+    ):
+        app = TRedisApp()
+        async with app.run_test(size=(120, 80)):
+            screen = app.screen
+            event = SimpleNamespace(option=SimpleNamespace(id="p1"))
+            await screen.on_option_list_option_selected(event)
+            host_input = screen.query_one("#host-input", Input)
+            assert host_input.value == "10.0.0.1"
+
+            host_input.value = "edited"
+            await screen.on_option_list_option_selected(event)
+
+            do_connect.assert_awaited_once()
+            assert host_input.value == "edited"
+
+
+async def test_build_profile_from_inputs_parses_and_defaults_fields():
+    with patch("tuiredis.screens.connect.load_connections", return_value=[]):
+        app = TRedisApp()
+        async with app.run_test(size=(120, 80)):
+            screen = app.screen
+            screen._inputs["host-input"].value = "  redis.local  "
+            screen._inputs["port-input"].value = "not-a-port"
+            screen._inputs["db-input"].value = "3"
+            screen._inputs["password-input"].value = " secret "
+            screen._inputs["ssh-host-input"].value = "bastion"  # ignored while SSH is off
+            screen._checkboxes["use-sentinel-checkbox"].value = True
+            screen._inputs["sentinel-port-input"].value = "26380"
+            screen._inputs["sentinel-master-input"].value = " mymaster "
+
+            profile = screen._build_profile_from_inputs()
+
+            assert profile["host"] == "redis.local"
+            assert profile["port"] == 6379
+            assert profile["db"] == 3
+            assert profile["password"] == " secret "
+            assert profile["sentinel_host"] is None
+            assert profile["sentinel_port"] == 26380
+            assert profile["sentinel_master_name"] == "mymaster"
+            assert profile["ssh_host"] is None
+            assert profile["ssh_port"] == 22
+            assert "id" not in profile
+
+
+async def test_refresh_history_updates_list_in_place():
+    from textual.widgets import OptionList
+
+    with patch("tuiredis.screens.connect.load_connections", return_value=[]):
+        app = TRedisApp()
+        async with app.run_test(size=(120, 80)) as pilot:
+            screen = app.screen
+            await screen._refresh_history([{"id": "a", "name": "A"}, {"id": "b", "name": "B"}])
+            history = screen.query_one("#history-list", OptionList)
+            option_a = history.get_option("a")
+
+            await screen._refresh_history([{"id": "a", "name": "A2"}, {"id": "c", "name": "C"}])
+            await pilot.pause()
+
+            assert [option.id for option in history.options] == ["a", "c"]
+            assert history.get_option("a") is option_a  # relabelled, not replaced
+            assert str(option_a.prompt) == "A2"
+
+            # Same ids and names: the list is left alone, but the stored profiles are refreshed.
+            with patch.object(history, "replace_option_prompt") as relabel, patch.object(history, "add_option") as add:
+                await screen._refresh_history([{"id": "a", "name": "A2", "host": "h"}, {"id": "c", "name": "C"}])
+            relabel.assert_not_called()
+            add.assert_not_called()
+            assert screen.profiles["a"]["host"] == "h"
+
+
 def test_validate_profile_allows_large_db_index():
     screen = ConnectScreen()
     profile: ConnectionProfile = {"host": "127.0.0.1", "port": 6379, "db": 42}
@@ -1,51 +1,110 @@
 import asyncio
+import copy
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
+import pytest_asyncio
 from textual.widgets import Input, Select
 
 from tuiredis.app import TRedisApp
 from tuiredis.redis_client import RedisClient
 from tuiredis.screens.main import MainScreen
+from tuiredis.screens.new_key_modal import NewKeyModal
 from tuiredis.widgets.key_detail import KeyDetail
 from tuiredis.widgets.key_tree import KeyTree
 from tuiredis.widgets.value_viewer import ValueViewer
 
 
+@pytest_asyncio.fixture(scope="module")
+async def shared_app():
+    """Start a single ``TRedisApp`` for the module; CSS parsing and startup are paid once."""
+    app = TRedisApp()
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        yield app, pilot
+
+
+@pytest_asyncio.fixture
+async def open_main(shared_app):
+    """Push a fresh ``MainScreen`` backed by the given client; pop it again after the test."""
+    app, pilot = shared_app
+    base_depth = len(app.screen_stack)
+
+    async def _open(client):
+        client.is_connected = True
+        app.redis_client = client
+        await app.push_screen(MainScreen())
+        await pilot.pause()
+        return app, pilot
+
+    yield _open
+    while len(app.screen_stack) > base_depth:
+        await app.pop_screen()
+    await pilot.pause()
+
+
+class StubRedisClient:
+    """Lightweight stand-in for ``RedisClient``.
+
+    Canned read results are preset; any other method becomes a ``MagicMock`` on
+    first access, so tests can still assert on calls without paying for a fully
+    introspected mock.
+    """
+
+    _RETURNS = {
+        "get_server_info": {"redis_version": "7.0.0", "db0": 10},
+        "get_db_size": 10,
+        "get_keyspace_info": {0: 10, 1: 5},
+        "get_database_count": 16,
+        "scan_keys_paginated": (0, ["user:1", "user:2"], {"user:1": "string", "user:2": "hash"}),
+        "get_types": {"user:1": "string", "user:2": "hash"},
+        "get_type": "string",
+        "get_ttl": -1,
+        "get_encoding": "raw",
+        "get_memory_usage": 128,
+        "get_key_metadata": ("string", -1, "raw", 128),
+        "get_key_bundle": ("string", -1, "raw", 128, "mock_value", None, 0),
+        "get_string": "mock_value",
+        "get_set": {"a", "b"},
+        "get_list": ["1", "2"],
+        "get_hash": {"f": "v"},
+        "get_zset": [("z1", 1.0)],
+        "get_list_count": 2,
+        "get_hash_count": 1,
+        "get_set_count": 2,
+        "get_zset_count": 1,
+        "get_value": ("mock_value", None, 0),
+        "add_member_and_get_value": ("string", "mock_value", None, 0),
+        "remove_member_and_get_value": ("string", "mock_value", None, 0),
+        "get_ttls": {},  # no expiry data by default
+        "scan_hash": (0, {}),
+        "scan_set": (0, []),
+    }
+
+    def __init__(self):
+        self.connection_label = "mock_host:6379"
+        self.use_cluster = False
+        self.use_sentinel = False
+        self.db = 0
+        self.password = None
+        for name, value in self._RETURNS.items():
+            setattr(self, name, MagicMock(return_value=copy.copy(value)))
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        method = MagicMock()
+        setattr(self, name, method)
+        return method
+
+
 @pytest.fixture
 def mock_redis_client():
-    client = MagicMock()
-    client.connection_label = "mock_host:6379"
-    client.use_cluster = False
-    client.use_sentinel = False
-    client.get_server_info.return_value = {"redis_version": "7.0.0", "db0": 10}
-    client.db = 0
-    client.password = None
-    client.get_db_size.return_value = 10
-    client.get_keyspace_info.return_value = {0: 10, 1: 5}
-    client.get_database_count.return_value = 16
-    client.scan_keys_paginated.return_value = (0, ["user:1", "user:2"])
-    client.get_types.return_value = {"user:1": "string", "user:2": "hash"}
-    client.get_type.return_value = "string"
-    client.get_ttl.return_value = -1
-    client.get_encoding.return_value = "raw"
-    client.get_memory_usage.return_value = 128
-    client.get_string.return_value = "mock_value"
-    client.get_set.return_value = {"a", "b"}
-    client.get_list.return_value = ["1", "2"]
-    client.get_hash.return_value = {"f": "v"}
-    client.get_zset.return_value = [("z1", 1.0)]
-    client.get_list_count.return_value = 2
-    client.get_hash_count.return_value = 1
-    client.get_set_count.return_value = 2
-    client.get_zset_count.return_value = 1
-    client.get_ttls.return_value = {}  # no expiry data by default
-    client.scan_hash.return_value = (0, {})
-    client.scan_set.return_value = (0, [])
-    return client
-
-
-@pytest.mark.asyncio
+    return StubRedisClient()
+
+
 async def test_app_auto_connect(mock_redis_client):
     """Test auto-connect bypassing the connect screen."""
     with patch.object(RedisClient, "connect", return_value=(True, "")):
@@ -58,231 +117,220 @@ async def test_app_auto_connect(mock_redis_client):
             app = TRedisApp(auto_connect=True)
             async with app.run_test(size=(120, 40)) as pilot:
                 assert isinstance(app.screen, MainScreen)
-                await pilot.pause(0.1)
+                await pilot.pause()
 
                 # Check if tree is populated
                 tree = app.screen.query_one(KeyTree)
                 assert len(tree.root.children) > 0
 
 
-@pytest.mark.asyncio
-async def test_main_screen_interactions(mock_redis_client):
-    app = TRedisApp()
-    # Inject our mock client directly
-    app.redis_client = mock_redis_client
-    app.redis_client.is_connected = True
+async def test_app_auto_connect_failure_stays_on_connect_screen():
+    from tuiredis.screens.connect import ConnectScreen
 
-    async with app.run_test(size=(120, 40)) as pilot:
-        # Push main screen manually
-        app.push_screen("main")
-        await pilot.pause(0.1)
+    with patch.object(RedisClient, "connect", return_value=(False, "refused")):
+        app = TRedisApp(auto_connect=True)
+        async with app.run_test(size=(120, 40)) as pilot:
+            await pilot.pause()
+            assert isinstance(app.screen, ConnectScreen)
+            assert any("refused" in str(n.message) for n in app._notifications)
 
-        main_screen = app.screen
-        assert isinstance(main_screen, MainScreen)
-
-        # Test switching DB
-        db_select = main_screen.query_one("#db-select", Select)
-        db_select.value = "1"
-        await pilot.pause(0.1)
-        mock_redis_client.switch_db.assert_called_with(1)
-
-        # Test key search filter
-        search_input = main_screen.query_one("#search-box", Input)
-        search_input.value = "user"
-        await pilot.pause(0.1)
-        tree = main_screen.query_one(KeyTree)
-        assert tree._filter == "user"
-
-        # Test selecting a key from tree
-        tree.post_message(KeyTree.KeySelected("user:1"))
-        await pilot.pause(0.1)
-
-        mock_redis_client.get_type.assert_called_with("user:1")
-        mock_redis_client.get_string.assert_called_with("user:1")
-
-        # Test Key Deletion flow
-        detail = main_screen.query_one(KeyDetail)
-        detail.post_message(KeyDetail.KeyDeleted("user:1"))
-        await pilot.pause(0.1)
-        mock_redis_client.delete_key.assert_called_with("user:1")
-
-        # Test Key TTL Set flow
-        detail.post_message(KeyDetail.TtlSet("user:1", 3600))
-        await pilot.pause(0.1)
-        mock_redis_client.set_ttl.assert_called_with("user:1", 3600)
-
-
-@pytest.mark.asyncio
-async def test_main_screen_db_switch_failure_keeps_original_selection(mock_redis_client):
+
+def test_app_import_defers_main_screen():
+    """Importing the app must not pull in the main screen and its widgets."""
+    code = "import sys, tuiredis.app; sys.exit('tuiredis.screens.main' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+async def test_main_screen_interactions(open_main, mock_redis_client):
+    app, pilot = await open_main(mock_redis_client)
+
+    main_screen = app.screen
+    assert isinstance(main_screen, MainScreen)
+    db_select, search_input, tree, detail = (
+        main_screen.query_one("#db-select", Select),
+        main_screen.query_one("#search-box", Input),
+        main_screen.query_one(KeyTree),
+        main_screen.query_one(KeyDetail),
+    )
+
+    # Test switching DB
+    db_select.value = "1"
+    await pilot.pause()
+    mock_redis_client.switch_db.assert_called_with(1)
+
+    # Test key search filter
+    with patch.object(tree, "filter_keys", wraps=tree.filter_keys) as filter_keys:
+        for text in ("u", "us", "user"):
+            search_input.value = text
+        await pilot.pause(MainScreen.SEARCH_DEBOUNCE_SECONDS + 0.1)
+    filter_keys.assert_called_once_with("user")  # fast typing is filtered once
+    assert tree._filter == "user"
+
+    # Test selecting a key from tree
+    tree.post_message(KeyTree.KeySelected("user:1"))
+    await pilot.pause()
+
+    # The type listed in the tree is passed on so metadata and value share a round trip.
+    mock_redis_client.get_key_bundle.assert_called_with("user:1", "string")
+
+    # Test Key Deletion flow
+    detail.post_message(KeyDetail.KeyDeleted("user:1"))
+    await pilot.pause()
+    mock_redis_client.delete_key.assert_called_with("user:1")
+
+    # Test Key TTL Set flow
+    detail.post_message(KeyDetail.TtlSet("user:1", 3600))
+    await pilot.pause()
+    mock_redis_client.set_ttl.assert_called_with("user:1", 3600)
+
+
+async def test_main_screen_db_switch_failure_keeps_original_selection(open_main, mock_redis_client):
     mock_redis_client.db = 0
     mock_redis_client.switch_db.return_value = False
 
-    app = TRedisApp()
-    app.redis_client = mock_redis_client
-    app.redis_client.is_connected = True
+    app, pilot = await open_main(mock_redis_client)
 
-    async with app.run_test(size=(120, 40)) as pilot:
-        app.push_screen("main")
-        await pilot.pause(0.1)
+    main_screen = app.screen
+    db_select = main_screen.query_one("#db-select", Select)
+    db_select.value = "1"
+    await pilot.pause()
 
-        main_screen = app.screen
-        db_select = main_screen.query_one("#db-select", Select)
-        db_select.value = "1"
-        await pilot.pause(0.1)
+    mock_redis_client.switch_db.assert_called_with(1)
+    assert db_select.value == "0"
 
-        mock_redis_client.switch_db.assert_called_with(1)
-        assert db_select.value == "0"
 
+async def test_main_screen_open_iredis_reports_missing_binary(open_main, mock_redis_client):
+    app, pilot = await open_main(mock_redis_client)
 
-@pytest.mark.asyncio
-async def test_main_screen_open_iredis_reports_missing_binary(mock_redis_client):
-    app = TRedisApp()
-    app.redis_client = mock_redis_client
-    app.redis_client.is_connected = True
+    main_screen = app.screen
+    with patch("tuiredis.screens.main.os.path.exists", return_value=False):
+        main_screen.action_open_iredis()
+    await pilot.pause()
 
-    async with app.run_test(size=(120, 40)) as pilot:
-        app.push_screen("main")
-        await pilot.pause(0.1)
+    assert main_screen._iredis_proc is None
 
-        main_screen = app.screen
-        with patch("tuiredis.screens.main.os.path.exists", return_value=False):
-            main_screen.action_open_iredis()
-        await pilot.pause(0.1)
 
-        assert main_screen._iredis_proc is None
+def test_iredis_url_uses_pool_address_and_quotes_password(mock_redis_client):
+    mock_redis_client.client.connection_pool.connection_kwargs = {"host": "10.0.0.5", "port": 6380}
+    mock_redis_client.password = "p@ss/word"
+    mock_redis_client.db = 3
+    assert MainScreen._iredis_url(mock_redis_client) == "redis://:p%40ss%2Fword@10.0.0.5:6380/3"
 
+    mock_redis_client.password = None
+    assert MainScreen._iredis_url(mock_redis_client) == "redis://10.0.0.5:6380/3"
 
-@pytest.mark.asyncio
-async def test_main_screen_db_options_expand_to_server_database_count(mock_redis_client):
+
+async def test_main_screen_db_options_expand_to_server_database_count(open_main, mock_redis_client):
     mock_redis_client.db = 20
     mock_redis_client.get_database_count.return_value = 32
     mock_redis_client.get_keyspace_info.return_value = {0: 10, 20: 3, 31: 1}
 
-    app = TRedisApp()
-    app.redis_client = mock_redis_client
-    app.redis_client.is_connected = True
+    app, pilot = await open_main(mock_redis_client)
+    await pilot.pause()  # the DB list is filled once the INFO reply is in
 
-    async with app.run_test(size=(120, 40)) as pilot:
-        app.push_screen("main")
-        await pilot.pause(0.1)
+    main_screen = app.screen
+    db_select = main_screen.query_one("#db-select", Select)
+    assert db_select.value == "20"
+    assert len(db_select._options) == 32
+    mock_redis_client.switch_db.assert_not_called()
+    # The keyspace comes from the INFO reply already fetched for the server panel.
+    mock_redis_client.get_keyspace_info.assert_called_once_with(mock_redis_client.get_server_info.return_value)
 
-        main_screen = app.screen
-        db_select = main_screen.query_one("#db-select", Select)
-        assert db_select.value == "20"
-        assert len(db_select._options) == 32
 
+async def test_main_screen_db_options_skip_rebuild_when_counts_unchanged(open_main, mock_redis_client):
+    app, pilot = await open_main(mock_redis_client)
+    await pilot.pause()
+    main_screen = app.screen
+    db_select = main_screen.query_one("#db-select", Select)
 
-@pytest.mark.asyncio
-async def test_main_screen_cluster_mode_disables_db_switch(mock_redis_client):
-    mock_redis_client.get_server_info.return_value = {"redis_version": "7.0.0", "redis_mode": "cluster"}
+    with patch.object(db_select, "set_options", wraps=db_select.set_options) as set_options:
+        await main_screen._load_db_options_async()
+        set_options.assert_not_called()
 
-    app = TRedisApp()
-    app.redis_client = mock_redis_client
-    app.redis_client.is_connected = True
+        mock_redis_client.get_keyspace_info.return_value = {0: 101}
+        await main_screen._load_db_options_async()
+        set_options.assert_called_once()
+    assert db_select.value == "0"
 
-    async with app.run_test(size=(120, 40)) as pilot:
-        app.push_screen("main")
-        await pilot.pause(0.2)
 
-        main_screen = app.screen
-        db_select = main_screen.query_one("#db-select", Select)
-        assert db_select.disabled is True
+async def test_main_screen_cluster_mode_disables_db_switch(open_main, mock_redis_client):
+    mock_redis_client.get_server_info.return_value = {"redis_version": "7.0.0", "redis_mode": "cluster"}
+
+    app, pilot = await open_main(mock_redis_client)
+
+    main_screen = app.screen
+    db_select = main_screen.query_one("#db-select", Select)
+    assert db_select.disabled is True
 
 
-@pytest.mark.asyncio
-async def test_main_screen_cluster_connection_starts_with_single_db_option(mock_redis_client):
+async def test_main_screen_cluster_connection_starts_with_single_db_option(open_main, mock_redis_client):
     mock_redis_client.use_cluster = True
     mock_redis_client.get_database_count.return_value = 1
     mock_redis_client.get_server_info.return_value = {"redis_version": "7.0.0", "redis_mode": "cluster"}
 
-    app = TRedisApp()
-    app.redis_client = mock_redis_client
-    app.redis_client.is_connected = True
-
-    async with app.run_test(size=(120, 40)) as pilot:
-        app.push_screen("main")
-        await pilot.pause(0.05)
+    app, pilot = await open_main(mock_redis_client)
 
-        main_screen = app.screen
-        db_select = main_screen.query_one("#db-select", Select)
-        assert db_select.disabled is True
-        assert db_select.value == "0"
-        assert len(db_select._options) == 1
+    main_screen = app.screen
+    db_select = main_screen.query_one("#db-select", Select)
+    assert db_select.disabled is True
+    assert db_select.value == "0"
+    assert len(db_select._options) == 1
 
 
-@pytest.mark.asyncio
-async def test_main_screen_sentinel_mode_disables_browsing(mock_redis_client):
+async def test_main_screen_sentinel_mode_disables_browsing(open_main, mock_redis_client):
     mock_redis_client.get_server_info.return_value = {"redis_version": "7.0.0", "redis_mode": "sentinel"}
     mock_redis_client.scan_keys_paginated.side_effect = AssertionError("scan should not run in sentinel mode")
 
-    app = TRedisApp()
-    app.redis_client = mock_redis_client
-    app.redis_client.is_connected = True
-
-    async with app.run_test(size=(120, 40)) as pilot:
-        app.push_screen("main")
-        await pilot.pause(0.2)
-
-        main_screen = app.screen
-        db_select = main_screen.query_one("#db-select", Select)
-        tree = main_screen.query_one(KeyTree)
-        viewer = main_screen.query_one(ValueViewer)
+    app, pilot = await open_main(mock_redis_client)
 
-        assert db_select.disabled is True
-        assert len(tree.root.children) == 0
-        assert viewer._current_key is None
+    main_screen = app.screen
+    db_select = main_screen.query_one("#db-select", Select)
+    tree = main_screen.query_one(KeyTree)
+    viewer = main_screen.query_one(ValueViewer)
 
+    assert db_select.disabled is True
+    assert len(tree.root.children) == 0
+    assert viewer._current_key is None
 
-@pytest.mark.asyncio
-async def test_main_screen_value_viewer_events(mock_redis_client):
-    app = TRedisApp()
-    app.redis_client = mock_redis_client
-    app.redis_client.is_connected = True
 
-    async with app.run_test(size=(120, 40)) as pilot:
-        app.push_screen("main")
-        await pilot.pause(0.2)
-        main_screen = app.screen
+async def test_main_screen_value_viewer_events(open_main, mock_redis_client):
+    app, pilot = await open_main(mock_redis_client)
+    main_screen = app.screen
 
-        viewer = main_screen.query_one(ValueViewer)
+    viewer = main_screen.query_one(ValueViewer)
 
-        # Test ValueSaved event (String)
-        viewer.post_message(ValueViewer.ValueSaved("mykey", "string", "new_val"))
-        await pilot.pause(0.1)
-        mock_redis_client.set_string.assert_called()
+    # Test ValueSaved event (String)
+    viewer.post_message(ValueViewer.ValueSaved("mykey", "string", "new_val"))
+    await pilot.pause()
+    mock_redis_client.set_string.assert_called()
 
-        # Test MemberAdded (Hash field)
-        viewer.post_message(ValueViewer.MemberAdded("myhash", "hash", ("field", "new_val_h")))
-        await pilot.pause(0.1)
-        mock_redis_client.hash_set.assert_called_with("myhash", "field", "new_val_h")
+    # Test MemberAdded (Hash field)
+    viewer.post_message(ValueViewer.MemberAdded("myhash", "hash", ("field", "new_val_h")))
+    await pilot.pause()
+    mock_redis_client.add_member_and_get_value.assert_called_with("myhash", "hash", ("field", "new_val_h"))
 
-        # Test MemberAdded (List) — data is (idx, val) tuple; None idx means append
-        viewer.post_message(ValueViewer.MemberAdded("mylist", "list", (None, "new_item")))
-        await pilot.pause(0.1)
-        mock_redis_client.list_push.assert_called_with("mylist", "new_item")
+    # Test MemberAdded (List) — data is (idx, val) tuple; None idx means append
+    viewer.post_message(ValueViewer.MemberAdded("mylist", "list", (None, "new_item")))
+    await pilot.pause()
+    mock_redis_client.add_member_and_get_value.assert_called_with("mylist", "list", (None, "new_item"))
 
-        # Test MemberAdded (Set)
-        viewer.post_message(ValueViewer.MemberAdded("myset", "set", "new_member"))
-        await pilot.pause(0.1)
-        mock_redis_client.set_add.assert_called_with("myset", "new_member")
+    # Test MemberAdded (Set)
+    viewer.post_message(ValueViewer.MemberAdded("myset", "set", "new_member"))
+    await pilot.pause()
+    mock_redis_client.add_member_and_get_value.assert_called_with("myset", "set", "new_member")
 
-        # Test MemberDeleted (List) — by index: sends (idx, None)
-        viewer.post_message(ValueViewer.MemberDeleted("mylist", "list", (1, None)))
-        await pilot.pause(0.1)
-        mock_redis_client.list_delete_by_index.assert_called_with("mylist", 1)
+    # Test MemberDeleted (List) — by index: sends (idx, None)
+    viewer.post_message(ValueViewer.MemberDeleted("mylist", "list", (1, None)))
+    await pilot.pause()
+    mock_redis_client.remove_member_and_get_value.assert_called_with("mylist", "list", (1, None))
 
-        # Test MemberDeleted (List) — by value fallback: sends (None, val)
-        viewer.post_message(ValueViewer.MemberDeleted("mylist", "list", (None, "old_item")))
-        await pilot.pause(0.1)
-        mock_redis_client.list_remove.assert_called_with("mylist", "old_item", 1)
+    # Test MemberDeleted (List) — by value fallback: sends (None, val)
+    viewer.post_message(ValueViewer.MemberDeleted("mylist", "list", (None, "old_item")))
+    await pilot.pause()
+    mock_redis_client.remove_member_and_get_value.assert_called_with("mylist", "list", (None, "old_item"))
 
 
-@pytest.mark.asyncio
-async def test_main_screen_stale_key_selection_does_not_override_latest(mock_redis_client):
-    app = TRedisApp()
-    app.redis_client = mock_redis_client
-    app.redis_client.is_connected = True
-
+async def test_main_screen_stale_key_selection_does_not_override_latest(open_main, mock_redis_client):
     slow_request_gate = asyncio.Event()
 
     async def fake_to_thread(func, *args, **kwargs):
@@ -296,31 +344,129 @@ async def test_main_screen_stale_key_selection_does_not_override_latest(mock_red
         return func(*args, **kwargs)
 
     with patch("tuiredis.screens.main.asyncio.to_thread", side_effect=fake_to_thread):
-        async with app.run_test(size=(120, 40)) as pilot:
-            app.push_screen("main")
-            await pilot.pause(0.1)
-            main_screen = app.screen
-            viewer = main_screen.query_one(ValueViewer)
+        app, pilot = await open_main(mock_redis_client)
+        main_screen = app.screen
+        viewer = main_screen.query_one(ValueViewer)
 
-            stale_task = asyncio.create_task(main_screen.on_key_tree_key_selected(KeyTree.KeySelected("user:1")))
-            await pilot.pause(0.05)
-            fresh_task = asyncio.create_task(main_screen.on_key_tree_key_selected(KeyTree.KeySelected("user:2")))
-            await pilot.pause(0.05)
+        stale_task = asyncio.create_task(main_screen.on_key_tree_key_selected(KeyTree.KeySelected("user:1")))
+        await pilot.pause()
+        fresh_task = asyncio.create_task(main_screen.on_key_tree_key_selected(KeyTree.KeySelected("user:2")))
+        await pilot.pause()
 
-            slow_request_gate.set()
-            await asyncio.gather(stale_task, fresh_task)
-            await pilot.pause(0.1)
+        slow_request_gate.set()
+        await asyncio.gather(stale_task, fresh_task)
+        await pilot.pause()
 
-            assert viewer._current_key == "user:2"
-            assert viewer._current_raw_data == "fresh-value"
+        assert viewer._current_key == "user:2"
+        assert viewer._current_raw_data == "fresh-value"
 
 
-@pytest.mark.asyncio
-async def test_main_screen_shows_loading_status_during_key_detail_fetch(mock_redis_client):
-    app = TRedisApp()
-    app.redis_client = mock_redis_client
-    app.redis_client.is_connected = True
+async def test_main_screen_virtual_key_value_is_fetched_off_the_event_loop(open_main, mock_redis_client):
+    mock_redis_client.get_key_bundle.return_value = ("none", -2, "unknown", None, None, None, 0)
+    mock_redis_client.get_value.return_value = ([], 0, 0)
+    threaded = []
+
+    async def fake_to_thread(func, *args, **kwargs):
+        threaded.append(getattr(func, "__name__", ""))
+        return func(*args, **kwargs)
+
+    with patch("tuiredis.screens.main.asyncio.to_thread", side_effect=fake_to_thread):
+        app, pilot = await open_main(mock_redis_client)
+        main_screen = app.screen
+        main_screen._virtual_keys["draft"] = "list"
+        mock_redis_client.get_value.reset_mock()
+        threaded.clear()
+
+        await main_screen.on_key_tree_key_selected(KeyTree.KeySelected("draft"))
+
+        assert threaded == ["_fetch_key_details_payload"]
+        mock_redis_client.get_value.assert_called_once_with("draft", "list")
+        assert main_screen.query_one(ValueViewer)._current_type == "list"
+
+
+async def test_main_screen_new_virtual_key_is_inserted_without_rescan(open_main, mock_redis_client):
+    app, pilot = await open_main(mock_redis_client)
+    main_screen = app.screen
+    mock_redis_client.scan_keys_paginated.reset_mock()
+
+    main_screen._on_new_key_created(NewKeyModal.KeyCreated("draft", "list", wrote_to_redis=False))
+    await pilot.pause()
+
+    mock_redis_client.scan_keys_paginated.assert_not_called()
+    assert main_screen._virtual_keys == {"draft": "list"}
+    assert "📋 draft" in [c.label.plain for c in main_screen.query_one(KeyTree).root.children]
+
+
+async def test_main_screen_page_limit_is_read_when_limit_box_is_submitted(open_main, mock_redis_client):
+    app, pilot = await open_main(mock_redis_client)
+    main_screen = app.screen
+    limit_box = main_screen.query_one("#limit-box", Input)
+
+    limit_box.value = "50"
+    assert main_screen._page_limit == 2000  # editing alone does not change the page size
+
+    await limit_box.action_submit()
+    await pilot.pause()
+    assert main_screen._page_limit == 50
+    assert mock_redis_client.scan_keys_paginated.call_args.kwargs["count"] == 50
+
+
+async def test_main_screen_lists_keys_without_types_when_disabled(open_main, mock_redis_client, monkeypatch):
+    app, pilot = await open_main(mock_redis_client)
+    main_screen = app.screen
+    mock_redis_client.scan_keys_paginated.reset_mock()
+    mock_redis_client.scan_keys_paginated.return_value = (0, ["user:1"])
+    monkeypatch.setattr(app, "include_types", False)
+
+    await main_screen._load_keys_async()
+
+    mock_redis_client.scan_keys_paginated.assert_called_once_with(cursor=0, pattern="*", count=2000)
+    mock_redis_client.get_types.assert_not_called()
+    assert main_screen.query_one(KeyTree)._key_types == {}
+
+
+async def test_fetch_keys_payload_merges_matching_virtual_keys(open_main, mock_redis_client):
+    mock_redis_client.scan_keys_paginated.return_value = (0, ["user:1", "user:draft"], {"user:1": "string"})
+    mock_redis_client.get_types.return_value = {"user:draft": "none"}
+    app, pilot = await open_main(mock_redis_client)
+    main_screen = app.screen
+    main_screen._virtual_keys.update({"user:draft": "hash", "user:new": "set", "order:new": "list"})
+
+    _, keys, key_types, _ = main_screen._fetch_keys_payload("user:*", 100)
+
+    assert keys == ["user:1", "user:draft", "user:new"]
+    assert key_types == {"user:1": "string", "user:draft": "hash", "user:new": "set"}
+
+
+async def test_main_screen_overlapping_key_loads_are_coalesced(open_main, mock_redis_client):
+    app, pilot = await open_main(mock_redis_client)
+    main_screen = app.screen
+    gate = asyncio.Event()
+    fetched = []
+
+    async def fake_to_thread(func, *args, **kwargs):
+        if getattr(func, "__name__", "") == "_fetch_keys_payload":
+            fetched.append(args[0])
+            if len(fetched) == 1:
+                await gate.wait()
+            return 0, [f"{args[0]}-key"], {}, {}
+        return func(*args, **kwargs)
+
+    with patch("tuiredis.screens.main.asyncio.to_thread", side_effect=fake_to_thread):
+        first = asyncio.create_task(main_screen._load_keys_async(pattern="a*"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(main_screen._load_keys_async(pattern="b*"))
+        third = asyncio.create_task(main_screen._load_keys_async(pattern="c*"))
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(first, second, third)
+
+    assert fetched == ["a*", "c*"]  # the middle request was folded into the follow-up
+    assert main_screen.query_one(KeyTree)._keys == ["c*-key"]
+    assert main_screen._keys_load is None
+
 
+async def test_main_screen_shows_loading_status_during_key_detail_fetch(open_main, mock_redis_client):
     slow_request_gate = asyncio.Event()
 
     async def fake_to_thread(func, *args, **kwargs):
@@ -330,153 +476,127 @@ async def test_main_screen_shows_loading_status_during_key_detail_fetch(mock_red
         return func(*args, **kwargs)
 
     with patch("tuiredis.screens.main.asyncio.to_thread", side_effect=fake_to_thread):
-        async with app.run_test(size=(120, 40)) as pilot:
-            app.push_screen("main")
-            await pilot.pause(0.1)
-            main_screen = app.screen
+        app, pilot = await open_main(mock_redis_client)
+        main_screen = app.screen
 
-            task = asyncio.create_task(main_screen.on_key_tree_key_selected(KeyTree.KeySelected("user:1")))
-            await pilot.pause(0.05)
-            status_bar = main_screen.query_one("#status-bar")
-            assert "Loading user:1..." in str(status_bar.render())
+        task = asyncio.create_task(main_screen.on_key_tree_key_selected(KeyTree.KeySelected("user:1")))
+        await pilot.pause()
+        status_bar = main_screen.query_one("#status-bar")
+        assert "Loading user:1..." in str(status_bar.render())
 
-            slow_request_gate.set()
-            await task
-            await pilot.pause(0.05)
-            assert str(status_bar.render()) == ""
+        slow_request_gate.set()
+        await task
+        await pilot.pause()
+        assert str(status_bar.render()) == ""
 
 
-@pytest.mark.asyncio
-async def test_key_rename_event(mock_redis_client):
+async def test_key_rename_event(open_main, mock_redis_client):
     """Test that KeyRenamed event calls rename_key on the client."""
     mock_redis_client.rename_key.return_value = True
-    mock_redis_client.get_type.return_value = "string"
-    mock_redis_client.get_string.return_value = "value"
-    mock_redis_client.get_ttl.return_value = -1
-    mock_redis_client.get_encoding.return_value = "raw"
-    mock_redis_client.get_memory_usage.return_value = 64
-
-    app = TRedisApp()
-    app.redis_client = mock_redis_client
+    mock_redis_client.get_key_bundle.return_value = ("string", -1, "raw", 64, "value", None, 0)
 
-    async with app.run_test(size=(120, 40)) as pilot:
-        app.push_screen("main")
-        await pilot.pause(0.2)
-        main_screen = app.screen
+    app, pilot = await open_main(mock_redis_client)
+    main_screen = app.screen
 
-        detail = main_screen.query_one(KeyDetail)
-        detail.post_message(KeyDetail.KeyRenamed("old_key", "new_key"))
-        await pilot.pause(0.2)
+    detail = main_screen.query_one(KeyDetail)
+    detail.post_message(KeyDetail.KeyRenamed("old_key", "new_key"))
+    await pilot.pause()
 
-        mock_redis_client.rename_key.assert_called_with("old_key", "new_key")
+    mock_redis_client.rename_key.assert_called_with("old_key", "new_key")
 
 
-@pytest.mark.asyncio
-async def test_main_screen_zset_events(mock_redis_client):
+async def test_main_screen_zset_events(open_main, mock_redis_client):
     """Test MemberAdded for ZSet and MemberDeleted for Hash/Set/ZSet."""
-    app = TRedisApp()
-    app.redis_client = mock_redis_client
-    app.redis_client.is_connected = True
 
-    async with app.run_test(size=(120, 40)) as pilot:
-        app.push_screen("main")
-        await pilot.pause(0.2)
-        main_screen = app.screen
-        viewer = main_screen.query_one(ValueViewer)
+    app, pilot = await open_main(mock_redis_client)
+    main_screen = app.screen
+    viewer = main_screen.query_one(ValueViewer)
+
+    # MemberAdded ZSet
+    viewer.post_message(ValueViewer.MemberAdded("myzset", "zset", ("member", 1.5)))
+    await pilot.pause()
+    mock_redis_client.add_member_and_get_value.assert_called_with("myzset", "zset", ("member", 1.5))
+
+    # MemberDeleted Hash
+    viewer.post_message(ValueViewer.MemberDeleted("myhash", "hash", "field1"))
+    await pilot.pause()
+    mock_redis_client.remove_member_and_get_value.assert_called_with("myhash", "hash", "field1")
 
-        # MemberAdded ZSet
-        viewer.post_message(ValueViewer.MemberAdded("myzset", "zset", ("member", 1.5)))
-        await pilot.pause(0.1)
-        mock_redis_client.zset_add.assert_called_with("myzset", "member", 1.5)
+    # MemberDeleted Set
+    viewer.post_message(ValueViewer.MemberDeleted("myset", "set", "member1"))
+    await pilot.pause()
+    mock_redis_client.remove_member_and_get_value.assert_called_with("myset", "set", "member1")
 
-        # MemberDeleted Hash
-        viewer.post_message(ValueViewer.MemberDeleted("myhash", "hash", "field1"))
-        await pilot.pause(0.1)
-        mock_redis_client.hash_delete.assert_called_with("myhash", "field1")
+    # MemberDeleted ZSet
+    viewer.post_message(ValueViewer.MemberDeleted("myzset", "zset", "member"))
+    await pilot.pause()
+    mock_redis_client.remove_member_and_get_value.assert_called_with("myzset", "zset", "member")
 
-        # MemberDeleted Set
-        viewer.post_message(ValueViewer.MemberDeleted("myset", "set", "member1"))
-        await pilot.pause(0.1)
-        mock_redis_client.set_remove.assert_called_with("myset", "member1")
 
-        # MemberDeleted ZSet
-        viewer.post_message(ValueViewer.MemberDeleted("myzset", "zset", "member"))
-        await pilot.pause(0.1)
-        mock_redis_client.zset_remove.assert_called_with("myzset", "member")
+async def test_main_screen_empty_key_page_keeps_tree_nodes(open_main, mock_redis_client):
+    mock_redis_client.scan_keys_paginated.return_value = (7, ["user:1", "user:2"], {})
+    app, pilot = await open_main(mock_redis_client)
+    tree = app.screen.query_one(KeyTree)
+    user_node = tree.root.children[0]
 
+    mock_redis_client.scan_keys_paginated.return_value = (0, [], {})
+    await app.screen.on_key_tree_load_more_clicked(KeyTree.LoadMoreClicked())
 
-@pytest.mark.asyncio
-async def test_main_screen_load_more_list(mock_redis_client):
+    assert tree._next_cursor == 0
+    assert list(tree.root.children) == [user_node]  # Load More node dropped, nothing rebuilt
+
+
+async def test_main_screen_load_more_list(open_main, mock_redis_client):
     """on_value_viewer_load_more for list calls get_list with correct offset."""
     mock_redis_client.get_list.return_value = ["item3", "item4"]
     mock_redis_client.get_list_count.return_value = 10
     mock_redis_client.DISPLAY_LIMIT = 500
 
-    app = TRedisApp()
-    app.redis_client = mock_redis_client
-    app.redis_client.is_connected = True
-
-    async with app.run_test(size=(120, 40)) as pilot:
-        app.push_screen("main")
-        await pilot.pause(0.2)
-        main_screen = app.screen
-        viewer = main_screen.query_one(ValueViewer)
+    app, pilot = await open_main(mock_redis_client)
+    main_screen = app.screen
+    viewer = main_screen.query_one(ValueViewer)
 
-        # Simulate a list already loaded (2 items) then request page 2
-        await viewer.show_value("mylist", "list", ["a", "b"], total_count=10)
-        await pilot.pause(0.1)
+    # Simulate a list already loaded (2 items) then request page 2
+    await viewer.show_value("mylist", "list", ["a", "b"], total_count=10)
+    await pilot.pause()
 
-        viewer.post_message(ValueViewer.LoadMore("mylist", "list", 2))
-        await pilot.pause(0.2)
+    viewer.post_message(ValueViewer.LoadMore("mylist", "list", 2))
+    await pilot.pause()
 
-        mock_redis_client.get_list.assert_called_with("mylist", start=2, end=501)
-        assert viewer._displayed_count == 4  # 2 original + 2 new
+    mock_redis_client.get_list.assert_called_with("mylist", start=2, end=501)
+    assert viewer._displayed_count == 4  # 2 original + 2 new
 
 
-@pytest.mark.asyncio
-async def test_main_screen_load_more_zset(mock_redis_client):
+async def test_main_screen_load_more_zset(open_main, mock_redis_client):
     """on_value_viewer_load_more for zset calls get_zset with correct offset."""
     mock_redis_client.get_zset.return_value = [("z3", 3.0)]
     mock_redis_client.get_zset_count.return_value = 5
     mock_redis_client.DISPLAY_LIMIT = 500
 
-    app = TRedisApp()
-    app.redis_client = mock_redis_client
-    app.redis_client.is_connected = True
+    app, pilot = await open_main(mock_redis_client)
+    main_screen = app.screen
+    viewer = main_screen.query_one(ValueViewer)
 
-    async with app.run_test(size=(120, 40)) as pilot:
-        app.push_screen("main")
-        await pilot.pause(0.2)
-        main_screen = app.screen
-        viewer = main_screen.query_one(ValueViewer)
+    await viewer.show_value("myzset", "zset", [("z1", 1.0), ("z2", 2.0)], total_count=5)
+    await pilot.pause()
 
-        await viewer.show_value("myzset", "zset", [("z1", 1.0), ("z2", 2.0)], total_count=5)
-        await pilot.pause(0.1)
+    viewer.post_message(ValueViewer.LoadMore("myzset", "zset", 2))
+    await pilot.pause()
 
-        viewer.post_message(ValueViewer.LoadMore("myzset", "zset", 2))
-        await pilot.pause(0.2)
+    mock_redis_client.get_zset.assert_called_with("myzset", start=2, end=501)
+    assert viewer._displayed_count == 3
 
-        mock_redis_client.get_zset.assert_called_with("myzset", start=2, end=501)
-        assert viewer._displayed_count == 3
 
-
-
-async def test_main_screen_member_deleted_key_gone(mock_redis_client):
+async def test_main_screen_member_deleted_key_gone(open_main, mock_redis_client):
     """If deleting last element makes key disappear, show_empty is called."""
-    mock_redis_client.get_type.return_value = "none"  # key gone after delete
-
-    app = TRedisApp()
-    app.redis_client = mock_redis_client
-    app.redis_client.is_connected = True
+    mock_redis_client.remove_member_and_get_value.return_value = ("none", None, None, 0)  # key gone after delete
 
-    async with app.run_test(size=(120, 40)) as pilot:
-        app.push_screen("main")
-        await pilot.pause(0.2)
-        main_screen = app.screen
-        viewer = main_screen.query_one(ValueViewer)
+    app, pilot = await open_main(mock_redis_client)
+    main_screen = app.screen
+    viewer = main_screen.query_one(ValueViewer)
 
-        viewer.post_message(ValueViewer.MemberDeleted("mylist", "list", (0, None)))
-        await pilot.pause(0.2)
+    viewer.post_message(ValueViewer.MemberDeleted("mylist", "list", (0, None)))
+    await pilot.pause()
 
-        # Viewer should be empty since key type is "none"
-        assert viewer._current_key is None
+    # Viewer should be empty since key type is "none"
+    assert viewer._current_key is None
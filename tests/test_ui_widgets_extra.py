@@ -35,7 +35,7 @@ async def test_command_input_submit_empty_does_not_add_history():
         inp = cmd.query_one("#cmd-input", Input)
         inp.value = ""
         await inp.action_submit()
-        await pilot.pause(0.1)
+        await pilot.pause()
         assert len(cmd._history) == 0
 
 
@@ -52,33 +52,49 @@ async def test_command_input_history_navigation():
         # Add two commands via submit
         inp.value = "PING"
         await inp.action_submit()
-        await pilot.pause(0.05)
+        await pilot.pause()
         inp.value = "GET foo"
         await inp.action_submit()
-        await pilot.pause(0.05)
+        await pilot.pause()
 
         assert len(cmd._history) == 2
 
         # Focus input and press up
         inp.focus()
         await pilot.press("up")
-        await pilot.pause(0.05)
+        await pilot.pause()
         assert inp.value == "GET foo"
 
         await pilot.press("up")
-        await pilot.pause(0.05)
+        await pilot.pause()
         assert inp.value == "PING"
 
         # Press down to go forward
         await pilot.press("down")
-        await pilot.pause(0.05)
+        await pilot.pause()
         assert inp.value == "GET foo"
 
         await pilot.press("down")
-        await pilot.pause(0.05)
+        await pilot.pause()
         assert inp.value == ""  # past end → cleared
 
 
+@pytest.mark.asyncio
+async def test_command_input_repeated_command_recorded_once():
+    """Submitting the same command twice in a row keeps a single history entry."""
+    app = DummyApp()
+    async with app.run_test() as pilot:
+        from textual.widgets import Input
+
+        cmd = app.query_one(CommandInput)
+        inp = cmd.query_one("#cmd-input", Input)
+        for value in ("PING", "PING", "GET foo", "PING"):
+            inp.value = value
+            await inp.action_submit()
+        await pilot.pause()
+        assert list(cmd._history) == ["PING", "GET foo", "PING"]
+
+
 @pytest.mark.asyncio
 async def test_command_input_write_result_error():
     """write_result with error prefix should not raise."""
@@ -86,7 +102,7 @@ async def test_command_input_write_result_error():
     async with app.run_test() as pilot:
         cmd = app.query_one(CommandInput)
         cmd.write_result("BADCMD", "(error) ERR syntax error")
-        await pilot.pause(0.1)
+        await pilot.pause()
 
 
 @pytest.mark.asyncio
@@ -98,7 +114,7 @@ async def test_command_input_write_result_ok_and_nil():
         cmd.write_result("PING", "PONG")
         cmd.write_result("SET x y", "OK")
         cmd.write_result("GET missing", "(nil)")
-        await pilot.pause(0.1)
+        await pilot.pause()
 
 
 # ── ServerInfo ────────────────────────────────────────────────────────────────
@@ -134,11 +150,29 @@ async def test_server_info_all_sections():
                 "db0": {"keys": 42},
             }
         )
-        await pilot.pause(0.1)
+        await pilot.pause()
         text = str(server_info.query_one("#si-text", Static).render())
         assert "7.0.5" in text
 
 
+@pytest.mark.asyncio
+async def test_server_info_skips_unchanged_snapshot():
+    """Re-applying the same INFO snapshot should not re-format the panel."""
+    from unittest.mock import patch
+
+    app = DummyApp()
+    async with app.run_test() as pilot:
+        server_info = app.query_one(ServerInfo)
+        info = {"redis_version": "7.0.5", "connected_clients": "5"}
+        with patch.object(ServerInfo, "_format_info", wraps=server_info._format_info) as fmt:
+            server_info.update_info(info)
+            server_info.update_info(dict(info))
+            await pilot.pause()
+            assert fmt.call_count == 1
+            server_info.update_info({**info, "connected_clients": "6"})
+            assert fmt.call_count == 2
+
+
 # ── ValueViewer row-select ───────────────────────────────────────────────────
 
 
@@ -151,12 +185,12 @@ async def test_value_viewer_hash_row_select_populates_inputs():
     async with app.run_test(size=(120, 40)) as pilot:
         viewer = app.query_one(ValueViewer)
         await viewer.show_value("myhash", "hash", {"name": "Alice"})
-        await pilot.pause(0.1)
+        await pilot.pause()
 
         table = viewer.query_one("#vv-table", DataTable)
         table.move_cursor(row=0)
         table.action_select_cursor()
-        await pilot.pause(0.1)
+        await pilot.pause()
 
         field_val = viewer.query_one("#vv-hash-fld", Input).value
         assert field_val == "name"
@@ -172,12 +206,12 @@ async def test_value_viewer_zset_row_select_populates_inputs():
     async with app.run_test(size=(120, 40)) as pilot:
         viewer = app.query_one(ValueViewer)
         await viewer.show_value("myzset", "zset", [("alpha", 2.5)])
-        await pilot.pause(0.1)
+        await pilot.pause()
 
         table = viewer.query_one("#vv-table", DataTable)
         table.move_cursor(row=0)
         table.action_select_cursor()
-        await pilot.pause(0.1)
+        await pilot.pause()
 
         assert viewer.query_one("#vv-zset-mem", Input).value == "alpha"
         assert viewer.query_one("#vv-zset-score", Input).value == "2.5"
@@ -193,12 +227,12 @@ async def test_value_viewer_set_row_select_populates_input():
     async with app.run_test(size=(120, 40)) as pilot:
         viewer = app.query_one(ValueViewer)
         await viewer.show_value("myset", "set", {"beta"})
-        await pilot.pause(0.1)
+        await pilot.pause()
 
         table = viewer.query_one("#vv-table", DataTable)
         table.move_cursor(row=0)
         table.action_select_cursor()
-        await pilot.pause(0.1)
+        await pilot.pause()
 
         assert viewer.query_one("#vv-set-val", Input).value == "beta"
 
@@ -217,7 +251,7 @@ async def test_value_viewer_hash_field_enter_triggers_save():
     async with app.run_test(size=(120, 40)) as pilot:
         viewer = app.query_one(ValueViewer)
         await viewer.show_value("myhash", "hash", {})
-        await pilot.pause(0.1)
+        await pilot.pause()
 
         original_post = viewer.post_message
 
@@ -230,7 +264,7 @@ async def test_value_viewer_hash_field_enter_triggers_save():
         viewer.query_one("#vv-hash-fld", Input).value = "k"
         viewer.query_one("#vv-hash-val").text = "v"
         await viewer.query_one("#vv-hash-fld", Input).action_submit()
-        await pilot.pause(0.1)
+        await pilot.pause()
 
     added = [m for m in captured if isinstance(m, ValueViewer.MemberAdded)]
     assert len(added) == 1
@@ -247,7 +281,7 @@ async def test_value_viewer_zset_score_enter_triggers_save():
     async with app.run_test(size=(120, 40)) as pilot:
         viewer = app.query_one(ValueViewer)
         await viewer.show_value("myzset", "zset", [])
-        await pilot.pause(0.1)
+        await pilot.pause()
 
         original_post = viewer.post_message
 
@@ -261,7 +295,7 @@ async def test_value_viewer_zset_score_enter_triggers_save():
         score_inp = viewer.query_one("#vv-zset-score", Input)
         score_inp.value = "5.0"
         await score_inp.action_submit()
-        await pilot.pause(0.1)
+        await pilot.pause()
 
     added = [m for m in captured if isinstance(m, ValueViewer.MemberAdded)]
     assert len(added) == 1
@@ -282,7 +316,7 @@ async def test_value_viewer_string_save_button():
     async with app.run_test(size=(120, 40)) as pilot:
         viewer = app.query_one(ValueViewer)
         await viewer.show_value("mykey", "string", "hello")
-        await pilot.pause(0.1)
+        await pilot.pause()
 
         original_post = viewer.post_message
 
@@ -294,7 +328,7 @@ async def test_value_viewer_string_save_button():
 
         btn = viewer.query_one("#vv-save-string", Button)
         viewer.on_button_pressed(Button.Pressed(btn))
-        await pilot.pause(0.1)
+        await pilot.pause()
 
     saved = [m for m in captured if isinstance(m, ValueViewer.ValueSaved)]
     assert len(saved) == 1
@@ -310,7 +344,7 @@ async def test_value_viewer_clear_hash_inputs():
     async with app.run_test(size=(120, 40)) as pilot:
         viewer = app.query_one(ValueViewer)
         await viewer.show_value("myhash", "hash", {"a": "b"})
-        await pilot.pause(0.1)
+        await pilot.pause()
 
         viewer.query_one("#vv-hash-fld", Input).value = "a"
         viewer.query_one("#vv-hash-val").text = "b"
@@ -318,7 +352,7 @@ async def test_value_viewer_clear_hash_inputs():
 
         clear_btn = viewer.query_one("#vv-clear-selection", Button)
         viewer.on_button_pressed(Button.Pressed(clear_btn))
-        await pilot.pause(0.1)
+        await pilot.pause()
 
         assert viewer.query_one("#vv-hash-fld", Input).value == ""
         assert not viewer._editing
@@ -335,7 +369,7 @@ async def test_value_viewer_list_delete_by_value():
     async with app.run_test(size=(120, 40)) as pilot:
         viewer = app.query_one(ValueViewer)
         await viewer.show_value("mylist", "list", ["alpha"])
-        await pilot.pause(0.1)
+        await pilot.pause()
 
         original_post = viewer.post_message
 
@@ -351,7 +385,7 @@ async def test_value_viewer_list_delete_by_value():
 
         btn = viewer.query_one("#vv-delete-list", Button)
         viewer.on_button_pressed(Button.Pressed(btn))
-        await pilot.pause(0.1)
+        await pilot.pause()
 
     deleted = [m for m in captured if isinstance(m, ValueViewer.MemberDeleted)]
     assert len(deleted) == 1
@@ -369,7 +403,7 @@ async def test_value_viewer_list_delete_no_input_shows_warning():
     async with app.run_test(size=(120, 40)) as pilot:
         viewer = app.query_one(ValueViewer)
         await viewer.show_value("mylist", "list", ["alpha"])
-        await pilot.pause(0.1)
+        await pilot.pause()
 
         original_post = viewer.post_message
 
@@ -384,7 +418,7 @@ async def test_value_viewer_list_delete_no_input_shows_warning():
 
         btn = viewer.query_one("#vv-delete-list", Button)
         viewer.on_button_pressed(Button.Pressed(btn))
-        await pilot.pause(0.1)
+        await pilot.pause()
 
     deleted = [m for m in captured if isinstance(m, ValueViewer.MemberDeleted)]
     assert len(deleted) == 0
@@ -15,6 +15,9 @@ def main():
     parser.add_argument("-a", "--password", default=None, help="Redis password")
     parser.add_argument("-n", "--db", type=int, default=0, help="Redis database number (default: 0)")
     parser.add_argument("-c", "--connect", action="store_true", help="Auto-connect on startup")
+    parser.add_argument(
+        "--no-types", action="store_true", help="List keys without looking up their types (faster over slow links)"
+    )
 
     # Cluster Arguments
     parser.add_argument("--cluster", action="store_true", help="Connect using Redis Cluster mode")
@@ -61,6 +64,7 @@ def main():
         ssh_user=args.ssh_user,
         ssh_password=args.ssh_password,
         ssh_private_key=args.ssh_key,
+        include_types=not args.no_types,
     )
     app.run()
 
@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 from textual.app import App
+from textual.screen import Screen
 
 from tuiredis.redis_client import RedisClient
-from tuiredis.screens.connect import ConnectScreen
-from tuiredis.screens.main import MainScreen
 
 CSS_PATH = Path(__file__).parent / "styles" / "app.tcss"
 
 
+# Screens are imported on first use: the main screen and its widgets are not
+# needed until a connection succeeds, so they stay off the startup path.
+def _connect_screen() -> Screen:
+    from tuiredis.screens.connect import ConnectScreen
+
+    return ConnectScreen()
+
+
+def _main_screen() -> Screen:
+    from tuiredis.screens.main import MainScreen
+
+    return MainScreen()
+
+
 class TRedisApp(App):
     """The TRedis terminal UI application."""
 
@@ -21,8 +35,8 @@ class TRedisApp(App):
     CSS_PATH = CSS_PATH
 
     SCREENS = {
-        "connect": ConnectScreen,
-        "main": MainScreen,
+        "connect": _connect_screen,
+        "main": _main_screen,
     }
 
     def __init__(
@@ -44,6 +58,7 @@ class TRedisApp(App):
         ssh_user: str | None = None,
         ssh_password: str | None = None,
         ssh_private_key: str | None = None,
+        include_types: bool = True,
     ):
         super().__init__()
         self.redis_client = RedisClient(
@@ -65,14 +80,18 @@ class TRedisApp(App):
             ssh_private_key=ssh_private_key,
         )
         self._auto_connect = auto_connect
+        # When False the key browser lists keys without TYPE lookups (useful over slow links).
+        self.include_types = include_types
 
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         self.theme = "dracula"
-        if self._auto_connect:
-            success, _ = self.redis_client.connect()
-            if success:
-                self.push_screen("main")
-            else:
-                self.push_screen("connect")
+        # Show the connect screen straight away; an auto-connect (possibly through an
+        # SSH tunnel) runs in a thread and moves on to the main screen when it succeeds.
+        self.push_screen("connect")
+        if not self._auto_connect:
+            return
+        success, err_msg = await asyncio.to_thread(self.redis_client.connect)
+        if success:
+            self.push_screen("main")
         else:
-            self.push_screen("connect")
+            self.notify(f"❌ {self.redis_client.connection_label} - {err_msg}", severity="error", timeout=6)
@@ -6,9 +6,16 @@ import json
 import logging
 import os
 import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import TypedDict, cast
 
+try:  # Optional C-accelerated JSON, installed with the "fast" extra.
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the extra is missing
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +46,38 @@ class ConnectionProfile(TypedDict, total=False):
     ssh_private_key: str | None
 
 
+# Working copy of the profiles while inside ``batched_writes``; ``None`` means write-through.
+_batch: list[ConnectionProfile] | None = None
+
+# Last parsed connections file as (path, mtime_ns, size, profiles); reused while the file is unchanged.
+_load_cache: tuple[Path, int, int, list[ConnectionProfile]] | None = None
+
+
+def _remember(config_file: Path, connections: list[ConnectionProfile]) -> None:
+    """Record ``connections`` as the parsed contents of ``config_file`` as it is now on disk."""
+    global _load_cache
+    try:
+        st = config_file.stat()
+    except OSError:
+        _load_cache = None
+        return
+    _load_cache = (config_file, st.st_mtime_ns, st.st_size, list(connections))
+
+
+def _dumps(connections: list[ConnectionProfile]) -> bytes:
+    """Serialize the profiles as indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(connections, option=orjson.OPT_INDENT_2)
+    return json.dumps(connections, indent=2).encode("utf-8")
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def get_config_dir() -> Path:
     """Return the configuration directory, creating it if necessary."""
     config_dir = Path.home() / ".tuiredis"
@@ -60,28 +99,121 @@ def get_connections_file() -> Path:
 def load_connections() -> list[ConnectionProfile]:
     """Load connection profiles from disk."""
     config_file = get_connections_file()
-    if not config_file.exists():
+    try:
+        st = config_file.stat()
+    except OSError:
         return []
 
+    cached = _load_cache
+    if cached is not None and cached[:3] == (config_file, st.st_mtime_ns, st.st_size):
+        return list(cached[3])
+
     try:
-        with open(config_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                return cast(list[ConnectionProfile], data)
-            return []
+        data = _loads(config_file.read_bytes())
+        if isinstance(data, list):
+            connections = cast(list[ConnectionProfile], data)
+            _remember(config_file, connections)
+            return list(connections)
+        return []
     except Exception as e:
         logger.error(f"Failed to load connections configuration: {e}")
         return []
 
 
+def _write_connections(connections: list[ConnectionProfile]) -> bool:
+    """Atomically write the profiles to disk. Returns whether the write succeeded."""
+    config_file = get_connections_file()
+    temp_file = config_file.with_suffix(".tmp")
+    try:
+        blob = _dumps(connections)
+        # Re-saving an unchanged profile is common (reconnecting from the list); skip the rewrite.
+        try:
+            if config_file.read_bytes() == blob:
+                _remember(config_file, connections)
+                return True
+        except OSError:
+            pass
+        # Create a temporary file, write data, set permissions, then rename
+        # This prevents permission race conditions on new files
+        with temp_file.open("wb") as f:
+            f.write(blob)
+        temp_file.chmod(0o600)  # Read/write by owner only
+        os.replace(temp_file, config_file)
+        _remember(config_file, connections)
+    except Exception as e:
+        logger.error(f"Failed to save connections configuration: {e}")
+        try:
+            temp_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+@contextmanager
+def batched_writes() -> Iterator[None]:
+    """Group several saves/deletes into a single write of connections.json.
+
+    Inside the block, ``save_connection`` and ``delete_connection`` work on an
+    in-memory copy and report ``persisted=True``; the file is written once when
+    the block exits. Nested blocks are folded into the outermost one.
+    """
+    global _batch
+    if _batch is not None:
+        yield
+        return
+
+    _batch = load_connections()
+    try:
+        yield
+    finally:
+        connections, _batch = _batch, None
+        _write_connections(connections)
+
+
+def _persist(connections: list[ConnectionProfile]) -> bool:
+    """Write the profiles now, or hand them to the active batch."""
+    global _batch
+    if _batch is not None:
+        _batch = connections
+        return True
+    return _write_connections(connections)
+
+
+# Fields that identify "the same connection" when a profile is saved without an ID.
+_DEDUP_FIELDS = (
+    "host",
+    "port",
+    "db",
+    "password",
+    "use_cluster",
+    "use_sentinel",
+    "sentinel_nodes",
+    "sentinel_host",
+    "sentinel_port",
+    "sentinel_master_name",
+    "sentinel_password",
+    "use_ssh",
+    "ssh_host",
+    "ssh_port",
+    "ssh_user",
+    "ssh_password",
+    "ssh_private_key",
+)
+
+
+def _dedup_key(profile: ConnectionProfile) -> tuple:
+    """Return the connection details that make two profiles duplicates."""
+    return tuple(profile.get(field) for field in _DEDUP_FIELDS)
+
+
 def save_connection(profile: ConnectionProfile) -> tuple[ConnectionProfile, list[ConnectionProfile], bool]:
     """Save a connection profile. If it lacks an ID, generate one.
     Updates existing profiles with the same ID.
     If no ID is passed, checks for existing profiles with the same connection details to update instead of duplicate.
     Returns a tuple of (saved_profile, updated_list_of_profiles, persisted).
     """
-    config_file = get_connections_file()
-    connections = load_connections()
+    connections = list(_batch) if _batch is not None else load_connections()
 
     # Ensure profile has a name
     if not profile.get("name"):
@@ -89,26 +221,9 @@ def save_connection(profile: ConnectionProfile) -> tuple[ConnectionProfile, list
 
     # Check for deduplication if no ID is provided
     if not profile.get("id"):
+        key = _dedup_key(profile)
         for conn in connections:
-            if (
-                conn.get("host") == profile.get("host")
-                and conn.get("port") == profile.get("port")
-                and conn.get("db") == profile.get("db")
-                and conn.get("password") == profile.get("password")
-                and conn.get("use_cluster") == profile.get("use_cluster")
-                and conn.get("use_sentinel") == profile.get("use_sentinel")
-                and conn.get("sentinel_nodes") == profile.get("sentinel_nodes")
-                and conn.get("sentinel_host") == profile.get("sentinel_host")
-                and conn.get("sentinel_port") == profile.get("sentinel_port")
-                and conn.get("sentinel_master_name") == profile.get("sentinel_master_name")
-                and conn.get("sentinel_password") == profile.get("sentinel_password")
-                and conn.get("use_ssh") == profile.get("use_ssh")
-                and conn.get("ssh_host") == profile.get("ssh_host")
-                and conn.get("ssh_port") == profile.get("ssh_port")
-                and conn.get("ssh_user") == profile.get("ssh_user")
-                and conn.get("ssh_password") == profile.get("ssh_password")
-                and conn.get("ssh_private_key") == profile.get("ssh_private_key")
-            ):
+            if _dedup_key(conn) == key:
                 # Found exact same connection details, update this one instead of creating new
                 profile["id"] = conn.get("id", str(uuid.uuid4()))
                 break
@@ -128,46 +243,12 @@ def save_connection(profile: ConnectionProfile) -> tuple[ConnectionProfile, list
     if not updated:
         connections.append(profile)
 
-    temp_file = config_file.with_suffix(".tmp")
-    try:
-        # Create a temporary file, write data, set permissions, then rename
-        # This prevents permission race conditions on new files
-        with temp_file.open("w", encoding="utf-8") as f:
-            json.dump(connections, f, indent=2)
-        temp_file.chmod(0o600)  # Read/write by owner only
-        os.replace(temp_file, config_file)
-    except Exception as e:
-        logger.error(f"Failed to save connections configuration: {e}")
-        try:
-            temp_file.unlink(missing_ok=True)
-        except OSError:
-            pass
-
-        return profile, connections, False
-
-    return profile, connections, True
+    return profile, connections, _persist(connections)
 
 
 def delete_connection(profile_id: str) -> tuple[list[ConnectionProfile], bool]:
     """Delete a connection profile by ID. Returns (updated_list, persisted)."""
-    config_file = get_connections_file()
-    connections = load_connections()
+    connections = _batch if _batch is not None else load_connections()
 
     connections = [c for c in connections if c.get("id") != profile_id]
-
-    temp_file = config_file.with_suffix(".tmp")
-    try:
-        with temp_file.open("w", encoding="utf-8") as f:
-            json.dump(connections, f, indent=2)
-        temp_file.chmod(0o600)
-        os.replace(temp_file, config_file)
-    except Exception as e:
-        logger.error(f"Failed to save connections configuration after deletion: {e}")
-        try:
-            temp_file.unlink(missing_ok=True)
-        except OSError:
-            pass
-
-        return connections, False
-
-    return connections, True
+    return connections, _persist(connections)
@@ -2,12 +2,53 @@
 
 from __future__ import annotations
 
+import atexit
+import shlex
+import threading
+import time
+from collections.abc import Callable, Iterator
+from itertools import chain, islice
+
 import redis
 
+# Returns TYPE for every key in KEYS, in order, so a page of keys costs one round trip.
+_TYPES_LUA = "local r = {} for i = 1, #KEYS do r[i] = redis.call('TYPE', KEYS[i]).ok end return r"
+
+# One SCAN step plus TYPE for every key it returned: {next_cursor, keys, types}.
+_SCAN_TYPES_LUA = """
+local r = redis.call('SCAN', ARGV[1], 'MATCH', ARGV[2], 'COUNT', ARGV[3])
+local types = {}
+for i = 1, #r[2] do types[i] = redis.call('TYPE', r[2][i]).ok end
+return {r[1], r[2], types}
+"""
+
+# Started SSH tunnels keyed by their SSH and remote endpoints. They outlive
+# disconnect() so reconnecting (or switching back to a profile) skips the SSH
+# handshake, and are stopped when the interpreter exits.
+_tunnel_pool: dict[tuple, object] = {}
+_tunnel_pool_lock = threading.Lock()
+
+
+def _stop_pooled_tunnels() -> None:
+    with _tunnel_pool_lock:
+        tunnels = list(_tunnel_pool.values())
+        _tunnel_pool.clear()
+    for tunnel in tunnels:
+        try:
+            tunnel.stop()
+        except Exception:
+            pass
+
+
+atexit.register(_stop_pooled_tunnels)
+
 
 class RedisClient:
     """Manages Redis connection and provides high-level operations."""
 
+    TYPES_SCRIPT_BATCH = 1000
+    MAX_CONNECTIONS = 8
+
     def __init__(
         self,
         host: str = "127.0.0.1",
@@ -48,7 +89,13 @@ class RedisClient:
 
         self._client: redis.Redis | None = None
         self._ssh_tunnel = None
+        self._ssh_tunnel_key: tuple | None = None
         self._cluster_scan_states: dict[str, dict[str, object]] = {}
+        self._types_script = None
+        self._scan_types_script = None
+        self._types_script_supported = True
+        self._last_ok = 0.0  # time.monotonic() of the last command that succeeded
+        self._database_count: int | None = None
 
     @property
     def client(self) -> redis.Redis:
@@ -72,12 +119,14 @@ class RedisClient:
 
     def _call_with_retry(self, operation):
         try:
-            return operation()
+            result = operation()
         except Exception as error:
             if not self._should_retry_after_error(error):
                 raise
             self._reconnect_for_retry()
-            return operation()
+            result = operation()
+        self._last_ok = time.monotonic()
+        return result
 
     def _get_sentinel_addresses(self) -> list[tuple[str, int]]:
         if self.sentinel_nodes:
@@ -102,6 +151,8 @@ class RedisClient:
 
         try:
             self._cluster_scan_states.clear()
+            self._types_script = None
+            self._scan_types_script = None
             if self.use_cluster and self.use_sentinel:
                 raise ValueError("Redis Cluster cannot be used together with Redis Sentinel")
             if self.use_cluster and self.ssh_host:
@@ -168,13 +219,31 @@ class RedisClient:
                 if self.ssh_password:
                     kwargs["ssh_password"] = self.ssh_password
 
-                self._ssh_tunnel = SSHTunnelForwarder(**kwargs)
-                self._ssh_tunnel.start()
+                tunnel_key = (
+                    self.ssh_host,
+                    self.ssh_port,
+                    self.ssh_user,
+                    self.ssh_password,
+                    self.ssh_private_key,
+                    self.host,
+                    self.port,
+                )
+                with _tunnel_pool_lock:
+                    tunnel = _tunnel_pool.get(tunnel_key)
+                    if tunnel is None or not tunnel.is_active:
+                        tunnel = SSHTunnelForwarder(**kwargs)
+                        tunnel.start()
+                        _tunnel_pool[tunnel_key] = tunnel
+                self._ssh_tunnel = tunnel
+                self._ssh_tunnel_key = tunnel_key
 
                 target_host = "127.0.0.1"
                 target_port = self._ssh_tunnel.local_bind_port
 
-            self._client = redis.Redis(
+            # A bounded blocking pool lets the UI's worker threads share a few sockets
+            # instead of opening one per concurrent request. redis-py parses replies with
+            # hiredis automatically when it is installed (the "fast" extra).
+            pool = redis.BlockingConnectionPool(
                 host=target_host,
                 port=target_port,
                 password=self.password or None,
@@ -182,11 +251,16 @@ class RedisClient:
                 decode_responses=True,
                 socket_connect_timeout=5,  # TCP handshake timeout (seconds)
                 socket_timeout=10,          # read/write timeout after connect
+                max_connections=self.MAX_CONNECTIONS,
+                timeout=10,  # seconds to wait for a free connection
             )
+            self._client = redis.Redis(connection_pool=pool)
             self._client.ping()
             return True, ""
         except Exception as e:
             err_msg = str(e) or repr(e)
+            # A tunnel that could not carry a working connection is not worth keeping.
+            self._discard_tunnel()
             self.disconnect()
             return False, err_msg
 
@@ -195,24 +269,46 @@ class RedisClient:
         cluster_scan_states = getattr(self, "_cluster_scan_states", None)
         if isinstance(cluster_scan_states, dict):
             cluster_scan_states.clear()
+        self._types_script = None
+        self._scan_types_script = None
+        self._last_ok = 0.0
+        self._database_count = None
         if self._client:
             try:
                 self._client.close()
+                # Clients built on an explicit pool leave it open on close().
+                pool = getattr(self._client, "connection_pool", None)
+                if isinstance(pool, redis.ConnectionPool):
+                    pool.disconnect()
             except Exception:
                 pass
             self._client = None
 
-        if self._ssh_tunnel:
-            try:
-                self._ssh_tunnel.stop()
-            except Exception:
-                pass
-            self._ssh_tunnel = None
+        # The tunnel itself stays in the pool for the next connect().
+        self._ssh_tunnel = None
+
+    def _discard_tunnel(self) -> None:
+        """Stop this client's SSH tunnel and drop it from the pool."""
+        tunnel, self._ssh_tunnel = self._ssh_tunnel, None
+        if tunnel is None:
+            return
+        with _tunnel_pool_lock:
+            if _tunnel_pool.get(self._ssh_tunnel_key) is tunnel:
+                del _tunnel_pool[self._ssh_tunnel_key]
+        try:
+            tunnel.stop()
+        except Exception:
+            pass
+
+    # A command that succeeded this recently is taken as proof of a live connection.
+    CONNECTED_GRACE_SECONDS = 2.0
 
     @property
     def is_connected(self) -> bool:
         if self._client is None:
             return False
+        if time.monotonic() - self._last_ok < self.CONNECTED_GRACE_SECONDS:
+            return True
         try:
             self._call_with_retry(lambda: self._client.ping())
             return True
@@ -232,26 +328,52 @@ class RedisClient:
 
     # ── Key Operations ───────────────────────────────────────────
 
-    def scan_keys(self, pattern: str = "*", count: int = 500) -> list[str]:
-        """Scan keys matching pattern using SCAN (non-blocking)."""
+    def iter_scan_keys(self, pattern: str = "*", count: int = 500) -> Iterator[list[str]]:
+        """Yield keys matching pattern one SCAN batch at a time, unsorted.
+
+        Callers that only need to walk the keyspace never hold more than one batch.
+        """
         if self.use_cluster:
-            return sorted(self.scan_keys_paginated(cursor=0, pattern=pattern, count=count)[1])
+            iterator = self.client.scan_iter(match=pattern, count=count)
+            while batch := list(islice(iterator, count)):
+                yield batch
+            return
 
-        keys: list[str] = []
         cursor = 0
         while True:
             cursor, batch = self._call_with_retry(
                 lambda current_cursor=cursor: self.client.scan(cursor=current_cursor, match=pattern, count=count)
             )
-            keys.extend(batch)
+            if batch:
+                yield batch
             if cursor == 0:
                 break
-        return sorted(keys)
 
-    def scan_keys_paginated(self, cursor: int = 0, pattern: str = "*", count: int = 2000) -> tuple[int, list[str]]:
-        """Return at least `count` keys (or fewer if exhausted) and the next cursor."""
+    def scan_keys(self, pattern: str = "*", count: int = 500) -> list[str]:
+        """Scan keys matching pattern using SCAN (non-blocking). Returns the full, sorted list."""
+        return sorted(chain.from_iterable(self.iter_scan_keys(pattern=pattern, count=count)))
+
+    # Upper bound for one SCAN COUNT hint; larger pages are accumulated over several steps
+    # so a big page size never asks the server to walk a huge slice of the keyspace at once.
+    SCAN_BATCH_SIZE = 500
+
+    def scan_keys_paginated(
+        self, cursor: int = 0, pattern: str = "*", count: int = 2000, with_types: bool = False
+    ) -> tuple[int, list[str]] | tuple[int, list[str], dict[str, str]]:
+        """Return at least `count` keys (or fewer if exhausted) and the next cursor.
+
+        With ``with_types=True`` a third item maps each key to its type. Where scripting
+        is available, each SCAN step and the TYPE lookups for its keys share one round trip.
+        """
         if self.use_cluster:
-            return self._scan_keys_paginated_cluster(cursor=cursor, pattern=pattern, count=count)
+            next_cursor, keys = self._scan_keys_paginated_cluster(cursor=cursor, pattern=pattern, count=count)
+            return (next_cursor, keys, self.get_types(keys)) if with_types else (next_cursor, keys)
+
+        if with_types and self._types_script_supported:
+            try:
+                return self._scan_keys_with_types_scripted(cursor, pattern, count)
+            except redis.ResponseError:
+                self._types_script_supported = False
 
         result_keys: list[str] = []
         next_cursor = cursor
@@ -259,9 +381,8 @@ class RedisClient:
         # Redis SCAN COUNT is a hint; often returns fewer keys or even 0 keys per call.
         # Loop until we accumulate the requested amount or finish the scan.
         while len(result_keys) < count:
-            request_count = max(
-                count - len(result_keys), 10
-            )  # slightly higher minimum to avoid spinning on small counts
+            # slightly higher minimum to avoid spinning on small counts
+            request_count = min(max(count - len(result_keys), 10), self.SCAN_BATCH_SIZE)
             next_cursor, batch = self._call_with_retry(
                 lambda current_cursor=next_cursor, current_count=request_count: self.client.scan(
                     cursor=current_cursor, match=pattern, count=current_count
@@ -271,13 +392,37 @@ class RedisClient:
             if next_cursor == 0:
                 break
 
+        if with_types:
+            return next_cursor, result_keys, self.get_types(result_keys)
         return next_cursor, result_keys
 
+    def _scan_keys_with_types_scripted(
+        self, cursor: int, pattern: str, count: int
+    ) -> tuple[int, list[str], dict[str, str]]:
+        result_keys: list[str] = []
+        key_types: dict[str, str] = {}
+        next_cursor = cursor
+
+        while len(result_keys) < count:
+            request_count = min(max(count - len(result_keys), 10), self.SCAN_BATCH_SIZE)
+            raw_cursor, batch, types = self._call_with_retry(
+                lambda current_cursor=next_cursor, current_count=request_count: self._get_scan_types_script()(
+                    args=[current_cursor, pattern, current_count]
+                )
+            )
+            next_cursor = int(raw_cursor)
+            result_keys.extend(batch)
+            key_types.update(zip(batch, types, strict=False))
+            if next_cursor == 0:
+                break
+
+        return next_cursor, result_keys, key_types
+
     def _scan_keys_paginated_cluster(self, cursor: int = 0, pattern: str = "*", count: int = 2000) -> tuple[int, list[str]]:
         state = self._cluster_scan_states.get(pattern)
         if state is None or cursor == 0 or cursor != state.get("offset", 0):
             state = {
-                "iterator": self.client.scan_iter(match=pattern, count=count),
+                "iterator": self.client.scan_iter(match=pattern, count=min(count, self.SCAN_BATCH_SIZE)),
                 "buffer": [],
                 "offset": 0,
             }
@@ -329,17 +474,41 @@ class RedisClient:
         return self._call_with_retry(lambda: self.client.type(key))  # type: ignore[return-value]
 
     def get_types(self, keys: list[str]) -> dict[str, str]:
-        """Return types for multiple keys efficiently using a pipeline."""
+        """Return types for multiple keys, batched server-side via Lua when scripting is available."""
         if not keys:
             return {}
         if self.use_cluster:
             return {key: self.get_type(key) for key in keys}
+        if self._types_script_supported:
+            try:
+                return self._get_types_scripted(keys)
+            except redis.ResponseError:
+                # Scripting disabled or denied by ACL; stick to pipelines for this client.
+                self._types_script_supported = False
         pipeline = self.client.pipeline(transaction=False)
         for key in keys:
             pipeline.type(key)
         types = self._call_with_retry(pipeline.execute)
         return dict(zip(keys, types, strict=False))
 
+    def _get_types_scripted(self, keys: list[str]) -> dict[str, str]:
+        types: dict[str, str] = {}
+        for start in range(0, len(keys), self.TYPES_SCRIPT_BATCH):
+            batch = keys[start : start + self.TYPES_SCRIPT_BATCH]
+            results = self._call_with_retry(lambda batch=batch: self._get_types_script()(keys=batch))
+            types.update(zip(batch, results, strict=False))
+        return types
+
+    def _get_types_script(self):
+        if self._types_script is None:
+            self._types_script = self.client.register_script(_TYPES_LUA)
+        return self._types_script
+
+    def _get_scan_types_script(self):
+        if self._scan_types_script is None:
+            self._scan_types_script = self.client.register_script(_SCAN_TYPES_LUA)
+        return self._scan_types_script
+
     def get_ttl(self, key: str) -> int:
         """Return TTL in seconds. -1 = no expiry, -2 = key missing."""
         return self._call_with_retry(lambda: self.client.ttl(key))  # type: ignore[return-value]
@@ -356,6 +525,75 @@ class RedisClient:
         except Exception:
             return None
 
+    def get_key_metadata(self, key: str) -> tuple[str, int, str, int | None]:
+        """Return (type, ttl, encoding, memory_usage) for a key in a single round trip.
+
+        Encoding and memory usage degrade to ``"unknown"`` / ``None`` when the server
+        refuses those commands, matching ``get_encoding`` and ``get_memory_usage``.
+        """
+        if self.use_cluster:
+            return self.get_type(key), self.get_ttl(key), self.get_encoding(key), self.get_memory_usage(key)
+
+        def _run():
+            pipeline = self.client.pipeline(transaction=False)
+            self._queue_metadata(pipeline, key)
+            return pipeline.execute(raise_on_error=False)
+
+        return self._metadata_from_replies(*self._call_with_retry(_run))
+
+    def get_key_bundle(
+        self, key: str, type_hint: str | None = None
+    ) -> tuple[str, int, str, int | None, object, int | None, int]:
+        """Return ``get_key_metadata(key)`` followed by ``get_value(key, type)``.
+
+        When *type_hint* (e.g. the type listed in the key browser) is right, the
+        metadata and the value share one round trip; otherwise the value is read
+        in a second one once the real type is known.
+        """
+        if self.use_cluster or type_hint not in ("string", "list", "hash", "set", "zset"):
+            key_type, ttl, encoding, memory = self.get_key_metadata(key)
+            return key_type, ttl, encoding, memory, *self.get_value(key, key_type)
+
+        def _run():
+            pipeline = self.client.pipeline(transaction=False)
+            self._queue_metadata(pipeline, key)
+            if type_hint == "string":
+                pipeline.get(key)
+            else:
+                self._queue_value_reads(pipeline, key, type_hint)
+            return pipeline.execute(raise_on_error=False)
+
+        replies = self._call_with_retry(_run)
+        key_type, ttl, encoding, memory = self._metadata_from_replies(*replies[:4])
+        if key_type != type_hint:
+            return key_type, ttl, encoding, memory, *self.get_value(key, key_type)
+
+        value_replies = replies[4:]
+        for reply in value_replies:
+            if isinstance(reply, Exception):
+                raise reply
+        if key_type == "string":
+            return key_type, ttl, encoding, memory, value_replies[0], None, 0
+        return key_type, ttl, encoding, memory, *self._value_from_replies(key, key_type, *value_replies)
+
+    @staticmethod
+    def _queue_metadata(pipeline, key: str) -> None:
+        pipeline.type(key)
+        pipeline.ttl(key)
+        pipeline.object("encoding", key)
+        pipeline.memory_usage(key)
+
+    @staticmethod
+    def _metadata_from_replies(key_type, ttl, encoding, memory) -> tuple[str, int, str, int | None]:
+        for reply in (key_type, ttl):
+            if isinstance(reply, Exception):
+                raise reply
+        if isinstance(encoding, Exception) or not encoding:
+            encoding = "unknown"
+        if isinstance(memory, Exception):
+            memory = None
+        return key_type, ttl, str(encoding), memory
+
     def delete_key(self, key: str) -> bool:
         """Delete a key. Returns True if the key was deleted."""
         return self._call_with_retry(lambda: self.client.delete(key)) > 0
@@ -424,17 +662,23 @@ class RedisClient:
     def list_remove(self, key: str, value: str, count: int = 1):
         self._call_with_retry(lambda: self.client.lrem(key, count, value))
 
+    _LIST_TOMBSTONE = "__TUIREDIS_DEL_TOMBSTONE__"
+
     def list_delete_by_index(self, key: str, index: int) -> None:
         """Delete the element at `index` from a list without touching duplicate values.
 
         Strategy: LSET the position to a unique tombstone, then LREM 1 occurrence.
         """
-        tombstone = "__TUIREDIS_DEL_TOMBSTONE__"
-        self._call_with_retry(lambda: self.client.lset(key, index, tombstone))
-        self._call_with_retry(lambda: self.client.lrem(key, 1, tombstone))
+        self._call_with_retry(lambda: self.client.lset(key, index, self._LIST_TOMBSTONE))
+        self._call_with_retry(lambda: self.client.lrem(key, 1, self._LIST_TOMBSTONE))
 
-    def get_hash(self, key: str) -> dict[str, str]:
-        count = self._call_with_retry(lambda: self.client.hlen(key))
+    def get_hash(self, key: str, count: int | None = None) -> dict[str, str]:
+        """Return the whole hash, or its first HSCAN page if it exceeds DISPLAY_LIMIT.
+
+        Pass *count* when HLEN is already known to skip asking for it again.
+        """
+        if count is None:
+            count = self._call_with_retry(lambda: self.client.hlen(key))
         if count <= self.DISPLAY_LIMIT:
             return self._call_with_retry(lambda: self.client.hgetall(key))  # type: ignore[return-value]
         result: dict[str, str] = {}
@@ -465,8 +709,13 @@ class RedisClient:
     def hash_delete(self, key: str, *fields: str):
         self._call_with_retry(lambda: self.client.hdel(key, *fields))
 
-    def get_set(self, key: str) -> set[str]:
-        count = self._call_with_retry(lambda: self.client.scard(key))
+    def get_set(self, key: str, count: int | None = None) -> set[str]:
+        """Return the whole set, or its first SSCAN page if it exceeds DISPLAY_LIMIT.
+
+        Pass *count* when SCARD is already known to skip asking for it again.
+        """
+        if count is None:
+            count = self._call_with_retry(lambda: self.client.scard(key))
         if count <= self.DISPLAY_LIMIT:
             return self._call_with_retry(lambda: self.client.smembers(key))  # type: ignore[return-value]
         result: set[str] = set()
@@ -509,6 +758,147 @@ class RedisClient:
     def zset_remove(self, key: str, *members: str):
         self._call_with_retry(lambda: self.client.zrem(key, *members))
 
+    def get_value(self, key: str, key_type: str) -> tuple[object, int | None, int]:
+        """Return (data, total_count, cursor) for the first page of a key's value.
+
+        For collections the length and the first page are fetched in one pipeline.
+        *total_count* is ``None`` for strings; *cursor* is non-zero only when a hash
+        or set larger than DISPLAY_LIMIT has more SCAN pages to load.
+        """
+        if key_type == "string":
+            return self.get_string(key), None, 0
+        if key_type not in ("list", "hash", "set", "zset"):
+            return None, None, 0
+        if self.use_cluster:
+            return self._get_value_unpipelined(key, key_type)
+
+        def _run():
+            pipeline = self.client.pipeline(transaction=False)
+            self._queue_value_reads(pipeline, key, key_type)
+            return pipeline.execute()
+
+        total, page = self._call_with_retry(_run)
+        return self._value_from_replies(key, key_type, total, page)
+
+    def _queue_value_reads(self, pipeline, key: str, key_type: str) -> None:
+        """Queue the length and first-page reads of a collection on *pipeline*."""
+        limit = self.DISPLAY_LIMIT
+        if key_type == "list":
+            pipeline.llen(key)
+            pipeline.lrange(key, 0, limit - 1)
+        elif key_type == "zset":
+            pipeline.zcard(key)
+            pipeline.zrange(key, 0, limit - 1, withscores=True)
+        elif key_type == "hash":
+            pipeline.hlen(key)
+            pipeline.hscan(key, cursor=0, count=limit)
+        else:
+            pipeline.scard(key)
+            pipeline.sscan(key, cursor=0, count=limit)
+
+    def _value_from_replies(self, key: str, key_type: str, total: int, page) -> tuple[object, int | None, int]:
+        """Turn the replies of ``_queue_value_reads`` into ``get_value``'s result."""
+        if key_type in ("list", "zset"):
+            return page, total, 0
+
+        next_cursor, items = int(page[0]), page[1]
+        if total > self.DISPLAY_LIMIT:
+            return (dict(items) if key_type == "hash" else list(items)), total, next_cursor
+        if next_cursor != 0:
+            # SCAN stopped short of a small collection; read the rest in one go.
+            return (self.get_hash(key, count=total) if key_type == "hash" else self.get_set(key, count=total)), total, 0
+        return (dict(items) if key_type == "hash" else set(items)), total, 0
+
+    def add_member_and_get_value(self, key: str, key_type: str, data) -> tuple[str, object, int | None, int]:
+        """Add or update one element of a collection, then return ``(type, data, total_count, cursor)``.
+
+        *data* is ``(index, value)`` for lists (``None`` index appends), ``(field, value)``
+        for hashes, ``(member, score)`` for sorted sets and the member for sets.
+        """
+
+        def queue_write(target) -> None:
+            if key_type == "list":
+                index, value = data
+                if index is not None:
+                    target.lset(key, index, value)
+                else:
+                    target.rpush(key, value)
+            elif key_type == "hash":
+                field, value = data
+                target.hset(key, field, value)
+            elif key_type == "set":
+                target.sadd(key, data)
+            elif key_type == "zset":
+                member, score = data
+                target.zadd(key, {member: score})
+
+        return self._write_and_get_value(key, key_type, queue_write)
+
+    def remove_member_and_get_value(self, key: str, key_type: str, data) -> tuple[str, object, int | None, int]:
+        """Remove one element of a collection, then return ``(type, data, total_count, cursor)``.
+
+        *data* is ``(index, value)`` for lists (by index when given, else the first
+        occurrence of *value*) and the field or member otherwise. The type is
+        ``"none"`` when the last element was removed.
+        """
+
+        def queue_write(target) -> None:
+            if key_type == "list":
+                index, value = data
+                if index is not None:
+                    target.lset(key, index, self._LIST_TOMBSTONE)
+                    target.lrem(key, 1, self._LIST_TOMBSTONE)
+                else:
+                    target.lrem(key, 1, value)
+            elif key_type == "hash":
+                target.hdel(key, data)
+            elif key_type == "set":
+                target.srem(key, data)
+            elif key_type == "zset":
+                target.zrem(key, data)
+
+        return self._write_and_get_value(key, key_type, queue_write)
+
+    def _write_and_get_value(
+        self, key: str, key_type: str, queue_write: Callable[[object], None]
+    ) -> tuple[str, object, int | None, int]:
+        """Run *queue_write*, TYPE and the first-page reads of *key* in one round trip."""
+        if self.use_cluster or key_type not in ("list", "hash", "set", "zset"):
+            self._call_with_retry(lambda: queue_write(self.client))
+            new_type = self.get_type(key)
+            return (new_type, *self.get_value(key, new_type))
+
+        def _run():
+            pipeline = self.client.pipeline(transaction=False)
+            queue_write(pipeline)
+            pipeline.type(key)
+            self._queue_value_reads(pipeline, key, key_type)
+            return pipeline.execute()
+
+        *_, new_type, total, page = self._call_with_retry(_run)
+        if new_type != key_type:
+            # The key is gone (or was replaced), so the queued reads do not apply.
+            return (new_type, *self.get_value(key, new_type))
+        return (new_type, *self._value_from_replies(key, key_type, total, page))
+
+    def _get_value_unpipelined(self, key: str, key_type: str) -> tuple[object, int | None, int]:
+        """``get_value`` for cluster connections, one command at a time."""
+        if key_type == "list":
+            return self.get_list(key), self.get_list_count(key), 0
+        if key_type == "zset":
+            return self.get_zset(key), self.get_zset_count(key), 0
+        if key_type == "hash":
+            total = self.get_hash_count(key)
+            if total <= self.DISPLAY_LIMIT:
+                return self.get_hash(key, count=total), total, 0
+            next_cursor, data = self.get_hash_page(key, cursor=0)
+            return data, total, next_cursor
+        total = self.get_set_count(key)
+        if total <= self.DISPLAY_LIMIT:
+            return self.get_set(key, count=total), total, 0
+        next_cursor, members = self.get_set_page(key, cursor=0)
+        return members, total, next_cursor
+
     # ── Server Info ──────────────────────────────────────────────
 
     def get_server_info(self) -> dict:
@@ -518,22 +908,22 @@ class RedisClient:
             return self._aggregate_cluster_info(info)
         return info  # type: ignore[return-value]
 
-    def get_keyspace_info(self) -> dict[int, int]:
-        """Return a mapping of db_index to key count."""
+    def get_keyspace_info(self, info: dict | None = None) -> dict[int, int]:
+        """Return a mapping of db_index to key count.
+
+        Pass a full INFO reply from ``get_server_info`` to read its keyspace section
+        instead of asking the server again (cluster connections always ask).
+        """
         try:
-            info = self._call_with_retry(lambda: self.client.info("keyspace"))
+            if info is None or self.use_cluster:
+                info = self._call_with_retry(lambda: self.client.info("keyspace"))
             if self.use_cluster:
                 return self._aggregate_cluster_keyspace(info)
-            result = {}
-            for key, val in info.items():
-                if key.startswith("db"):
-                    try:
-                        db_idx = int(key[2:])
-                        if isinstance(val, dict):
-                            result[db_idx] = val.get("keys", 0)
-                    except ValueError:
-                        pass
-            return result
+            return {
+                int(key[2:]): val.get("keys", 0)
+                for key, val in info.items()
+                if isinstance(val, dict) and key.startswith("db") and key[2:].isdigit()
+            }
         except Exception:
             return {}
 
@@ -541,6 +931,9 @@ class RedisClient:
         """Return the configured number of logical databases."""
         if self.use_cluster:
             return 1
+        # "databases" can only change with a server restart, so one lookup per connection is enough.
+        if self._database_count is not None:
+            return self._database_count
 
         try:
             config = self._call_with_retry(lambda: self.client.config_get("databases"))
@@ -548,6 +941,7 @@ class RedisClient:
             if raw_value is not None:
                 count = int(raw_value)
                 if count > 0:
+                    self._database_count = count
                     return count
         except Exception:
             pass
@@ -668,9 +1062,24 @@ class RedisClient:
                         continue
         return totals
 
+    # Maximum number of top-level reply items rendered in the console; KEYS * on a
+    # large keyspace would otherwise build (and log) one line per key.
+    COMMAND_RESULT_LIMIT = 10_000
+
     def execute_command(self, command_str: str) -> str:
-        """Execute a raw Redis command string and return the result."""
-        parts = command_str.strip().split()
+        """Execute a raw Redis command string and return the result.
+
+        Arguments may be quoted (``SET greeting "hello world"``); commands without
+        quotes take the plain ``str.split`` path.
+        """
+        command_str = command_str.strip()
+        if '"' in command_str or "'" in command_str:
+            try:
+                parts = shlex.split(command_str)
+            except ValueError as e:
+                return f"(error) {e}"
+        else:
+            parts = command_str.split()
         if not parts:
             return ""
         cmd = parts[0].upper()
@@ -696,29 +1105,32 @@ class RedisClient:
             if not result:
                 return "(empty list)"
             prefix = " " * indent
-            lines = []
-            for i, item in enumerate(result, 1):
-                formatted = self._format_command_result(item, indent + 2)
-                if "\n" in formatted:
-                    lines.append(f"{prefix}{i})")
-                    lines.append(formatted)
-                else:
-                    lines.append(f"{prefix}{i}) {formatted}")
-            return "\n".join(lines)
+            shown = islice(result, self.COMMAND_RESULT_LIMIT) if indent == 0 else result
+            body = "\n".join(
+                self._format_entry(f"{prefix}{i})", self._format_command_result(item, indent + 2))
+                for i, item in enumerate(shown, 1)
+            )
+            hidden = len(result) - self.COMMAND_RESULT_LIMIT
+            if indent == 0 and hidden > 0:
+                body += f"\n... ({hidden:,} more items not shown)"
+            return body
         if isinstance(result, dict):
             prefix = " " * indent
-            lines = []
-            for key, value in result.items():
-                rendered_key = self._format_command_result(key)
-                formatted = self._format_command_result(value, indent + 2)
-                if "\n" in formatted:
-                    lines.append(f"{prefix}{rendered_key}:")
-                    lines.append(formatted)
-                else:
-                    lines.append(f"{prefix}{rendered_key}: {formatted}")
-            return "\n".join(lines)
+            return "\n".join(
+                self._format_entry(
+                    f"{prefix}{self._format_command_result(key)}:", self._format_command_result(value, indent + 2)
+                )
+                for key, value in result.items()
+            )
         return str(result)
 
+    @staticmethod
+    def _format_entry(label: str, formatted: str) -> str:
+        """Put a scalar on the label's line, or a multi-line value on the lines below it."""
+        if "\n" in formatted:
+            return f"{label}\n{formatted}"
+        return f"{label} {formatted}"
+
     @property
     def connection_label(self) -> str:
         """Human-readable connection string."""
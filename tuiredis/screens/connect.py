@@ -2,16 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
+from typing import cast
 
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Center, Horizontal, Vertical, VerticalScroll
 from textual.events import Mount
 from textual.screen import Screen
-from textual.widgets import Button, Checkbox, Footer, Header, Input, Label, ListItem, ListView, Static
+from textual.widgets import Button, Checkbox, Footer, Header, Input, OptionList, Static
+from textual.widgets.option_list import Option
 
 from tuiredis.config import ConnectionProfile, delete_connection, load_connections, save_connection
+from tuiredis.redis_client import RedisClient
+
+# Banner shown above the form; colour and weight come from the .ascii-art rule.
+_ASCII_ART = (
+    "\n"
+    "  _____      _ ____          _ _     \n"
+    " |_   _|   _(_)  _ \\ ___  __| (_)___ \n"
+    "   | || | | | | |_) / _ \\/ _` | / __|\n"
+    "   | || |_| | |  _ <  __/ (_| | \\__ \\\n"
+    "   |_| \\__,_|_|_| \\_\\___|\\__,_|_|___/"
+)
 
 
 class ConnectScreen(Screen):
@@ -19,12 +33,37 @@ class ConnectScreen(Screen):
 
     BINDINGS = [Binding("q", "quit", "Quit", priority=True)]
 
+    DOUBLE_CLICK_SECONDS = 0.5
+
+    # Form fields as (profile key, input id, default, parser); a ``None`` parser keeps the raw value.
+    _BASE_FIELDS = (
+        ("name", "profile-name-input", "", str),
+        ("host", "host-input", "127.0.0.1", str),
+        ("port", "port-input", 6379, int),
+        ("db", "db-input", 0, int),
+        ("password", "password-input", None, None),
+    )
+    _SENTINEL_FIELDS = (
+        ("sentinel_nodes", "sentinel-nodes-input", None, str),
+        ("sentinel_host", "sentinel-host-input", None, str),
+        ("sentinel_port", "sentinel-port-input", 26379, int),
+        ("sentinel_master_name", "sentinel-master-input", None, str),
+        ("sentinel_password", "sentinel-password-input", None, None),
+    )
+    _SSH_FIELDS = (
+        ("ssh_host", "ssh-host-input", None, str),
+        ("ssh_port", "ssh-port-input", 22, int),
+        ("ssh_user", "ssh-user-input", None, str),
+        ("ssh_password", "ssh-password-input", None, None),
+        ("ssh_private_key", "ssh-key-input", None, str),
+    )
+
     DEFAULT_CSS = """
     ConnectScreen {
         align: center middle;
         background: $surface-darken-2;
     }
-    ConnectScreen #main-container {
+    #main-container {
         width: 100;
         height: auto;
         min-height: 80%;
@@ -32,7 +71,7 @@ class ConnectScreen(Screen):
         align: center middle;
         layout: horizontal;
     }
-    ConnectScreen #history-card {
+    #history-card {
         width: 32;
         height: 100%;
         padding: 1 2;
@@ -41,10 +80,10 @@ class ConnectScreen(Screen):
         margin-right: 2;
         display: none;
     }
-    ConnectScreen #history-card.has-history {
+    #history-card.has-history {
         display: block;
     }
-    ConnectScreen .history-title {
+    .history-title {
         text-align: center;
         text-style: bold;
         color: #DC382D;
@@ -52,133 +91,110 @@ class ConnectScreen(Screen):
         border-bottom: solid $surface-lighten-2;
         width: 1fr;
     }
-    ConnectScreen .history-header {
+    .history-header {
         width: 100%;
         height: auto;
         margin-bottom: 1;
     }
-    ConnectScreen #new-conn-btn {
+    #new-conn-btn {
         min-width: 4;
         width: 4;
         height: 1;
         padding: 0;
         margin: 0 0 0 1;
     }
-    ConnectScreen #history-list {
+    #history-list {
         height: 1fr;
         background: transparent;
     }
-    ConnectScreen #history-list ListItem {
+    #history-list > .option-list--option {
         padding: 1;
     }
-    ConnectScreen #delete-btn {
+    #delete-btn {
         width: 100%;
         margin-top: 1;
         display: none;
     }
-    ConnectScreen #delete-btn.visible {
+    #delete-btn.visible {
         display: block;
     }
-    ConnectScreen #connect-card {
+    #connect-card {
         width: 64;
         height: 100%;
         padding: 1 2;
         border: heavy #DC382D;
         background: $surface;
     }
-    ConnectScreen #form-scroll {
+    #form-scroll {
         height: 1fr;
         width: 100%;
         overflow-y: auto;
         scrollbar-size: 1 1;
     }
-    ConnectScreen #connect-title {
+    #connect-title {
         text-align: center;
         text-style: bold;
         color: #DC382D;
         padding: 1 0;
         width: 100%;
     }
-    ConnectScreen #connect-subtitle {
+    #connect-subtitle {
         text-align: center;
         color: $text-muted;
         padding: 0 0 1 0;
         width: 100%;
     }
-    ConnectScreen .form-label {
+    .form-label {
         margin: 1 0 0 0;
         color: $text;
         text-style: bold;
     }
-    ConnectScreen Input {
+    Input {
         margin: 0 0 1 0;
     }
-    ConnectScreen #connect-row {
-        height: auto;
-        margin: 0;
-    }
-    ConnectScreen #connect-row Input {
-        width: 1fr;
-    }
-    ConnectScreen .action-row {
+    .action-row {
         height: auto;
         margin: 1 0 0 0;
         width: 100%;
     }
-    ConnectScreen .action-row Button {
+    .action-row Button {
         width: 1fr;
         margin: 0 1;
     }
-    ConnectScreen #connect-error {
+    #connect-error {
         text-align: center;
         color: $error;
         padding: 1 0;
         display: none;
     }
-    ConnectScreen #connect-error.visible {
+    #connect-error.visible {
         display: block;
     }
-    ConnectScreen .ascii-art {
+    .ascii-art {
         text-align: center;
+        text-style: bold;
         color: #DC382D;
         padding: 0 0 1 0;
         width: 100%;
     }
-    ConnectScreen #ssh-card {
-        display: none;
-        height: auto;
-        border-top: tall $surface-lighten-2;
-        margin: 1 0 0 0;
-        padding: 1 0 0 0;
-    }
-    ConnectScreen #sentinel-card {
+    .option-card {
         display: none;
         height: auto;
         border-top: tall $surface-lighten-2;
         margin: 1 0 0 0;
         padding: 1 0 0 0;
     }
-    ConnectScreen #sentinel-card.visible {
+    .option-card.visible {
         display: block;
     }
-    ConnectScreen #ssh-card.visible {
-        display: block;
-    }
-    ConnectScreen #sentinel-row {
-        height: auto;
-        margin: 0;
-    }
-    ConnectScreen #sentinel-row Input {
-        width: 1fr;
-    }
-    ConnectScreen #ssh-row {
+    .form-row {
         height: auto;
         margin: 0;
     }
-    ConnectScreen #ssh-row Input {
+    .form-row Input {
         width: 1fr;
     }
-    ConnectScreen Checkbox {
+    Checkbox {
         margin: 1 0 0 0;
         width: 1fr;
     }
@@ -188,6 +204,11 @@ class ConnectScreen(Screen):
         super().__init__(**kwargs)
         self.profiles: dict[str, ConnectionProfile] = {}
         self.current_profile_id: str | None = None
+        self._inputs: dict[str, Input] = {}
+        self._checkboxes: dict[str, Checkbox] = {}
+        self._history_names: dict[str, str] = {}  # profile id → label currently in the history list
+        self._last_click_id: str | None = None
+        self._last_click_time = 0.0
 
     def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
         """Prevent 'q' from quitting the app when typing in an Input."""
@@ -204,20 +225,12 @@ class ConnectScreen(Screen):
                     with Horizontal(classes="history-header"):
                         yield Static("Saved Connections", classes="history-title")
                         yield Button("➕", id="new-conn-btn", variant="success", tooltip="New Connection")
-                    yield ListView(id="history-list")
+                    yield OptionList(id="history-list")
                     yield Button("🗑 Delete", variant="error", id="delete-btn")
 
                 with Vertical(id="connect-card"):
                     with VerticalScroll(id="form-scroll"):
-                        yield Static(
-                            "[bold #DC382D]\n"
-                            "  _____      _ ____          _ _     \n"
-                            " |_   _|   _(_)  _ \\ ___  __| (_)___ \n"
-                            "   | || | | | | |_) / _ \\/ _` | / __|\n"
-                            "   | || |_| | |  _ <  __/ (_| | \\__ \\\n"
-                            "   |_| \\__,_|_|_| \\_\\___|\\__,_|_|___/[/]",
-                            classes="ascii-art",
-                        )
+                        yield Static(_ASCII_ART, classes="ascii-art", markup=False)
                         yield Static("Redis Terminal UI Client", id="connect-subtitle")
 
                         yield Static("Profile Name", classes="form-label")
@@ -225,7 +238,7 @@ class ConnectScreen(Screen):
 
                         yield Static("Host", classes="form-label")
                         yield Input(value="127.0.0.1", placeholder="Redis host", id="host-input")
-                        with Horizontal(id="connect-row"):
+                        with Horizontal(id="connect-row", classes="form-row"):
                             yield Input(value="6379", placeholder="Port", id="port-input", type="integer")
                             yield Input(value="0", placeholder="DB", id="db-input", type="integer")
                         yield Static("Password", classes="form-label")
@@ -234,9 +247,9 @@ class ConnectScreen(Screen):
                         yield Checkbox("Use Redis Cluster", id="use-cluster-checkbox")
 
                         yield Checkbox("Use Redis Sentinel", id="use-sentinel-checkbox")
-                        with Vertical(id="sentinel-card"):
+                        with Vertical(id="sentinel-card", classes="option-card"):
                             yield Static("Sentinel Host & Port", classes="form-label")
-                            with Horizontal(id="sentinel-row"):
+                            with Horizontal(id="sentinel-row", classes="form-row"):
                                 yield Input(placeholder="Sentinel host", id="sentinel-host-input")
                                 yield Input(value="26379", placeholder="Port", id="sentinel-port-input", type="integer")
                             yield Input(
@@ -249,9 +262,9 @@ class ConnectScreen(Screen):
                             yield Input(placeholder="(optional)", password=True, id="sentinel-password-input")
 
                         yield Checkbox("Use SSH Tunnel", id="use-ssh-checkbox")
-                        with Vertical(id="ssh-card"):
+                        with Vertical(id="ssh-card", classes="option-card"):
                             yield Static("SSH Host & Port", classes="form-label")
-                            with Horizontal(id="ssh-row"):
+                            with Horizontal(id="ssh-row", classes="form-row"):
                                 yield Input(placeholder="SSH host", id="ssh-host-input")
                                 yield Input(value="22", placeholder="Port", id="ssh-port-input", type="integer")
                             yield Static("SSH User", classes="form-label")
@@ -269,111 +282,133 @@ class ConnectScreen(Screen):
         yield Footer()
 
     async def on_mount(self, event: Mount) -> None:
+        # The form never changes shape after compose; resolve its widgets once.
+        self._inputs = {widget.id: widget for widget in self.query(Input) if widget.id}
+        self._checkboxes = {widget.id: widget for widget in self.query(Checkbox) if widget.id}
+        self._history_card = self.query_one("#history-card", Vertical)
+        self._history_list = self.query_one("#history-list", OptionList)
+        self._delete_btn = self.query_one("#delete-btn", Button)
+        self._error_label = self.query_one("#connect-error", Static)
+        self._connect_btn = self.query_one("#connect-btn", Button)
+        # Checkbox id → the optional card it shows.
+        self._option_cards = {
+            "use-ssh-checkbox": self.query_one("#ssh-card", Vertical),
+            "use-sentinel-checkbox": self.query_one("#sentinel-card", Vertical),
+        }
         await self._refresh_history()
 
-    async def _refresh_history(self) -> None:
-        raw_profiles = load_connections()
-        self.profiles = {p["id"]: p for p in raw_profiles}
-
-        history_card = self.query_one("#history-card")
-        list_view = self.query_one("#history-list", ListView)
+    async def _refresh_history(self, profiles: list[ConnectionProfile] | None = None) -> None:
+        """Rebuild the saved-connections list.
 
-        await list_view.clear()
-
-        if self.profiles:
-            history_card.add_class("has-history")
-            for pid, profile in self.profiles.items():
-                list_view.append(ListItem(Label(profile["name"]), id=f"prof-{pid}"))
-        else:
-            history_card.remove_class("has-history")
+        ``profiles`` is the list a save or delete just returned; passing it avoids
+        reading connections.json back from disk.
+        """
+        raw_profiles = profiles if profiles is not None else load_connections()
+        self.profiles = {p["id"]: p for p in raw_profiles}
+        names = {pid: profile["name"] for pid, profile in self.profiles.items()}
+        if list(names.items()) == list(self._history_names.items()):
+            return  # Same labels in the same order (e.g. re-saving a profile): nothing to redraw.
+
+        # Patch the list in place: drop removed profiles, relabel renamed ones and
+        # append new ones, instead of rebuilding every option.
+        history = self._history_list
+        for option in list(history.options):
+            if option.id not in self.profiles:
+                history.remove_option(option.id)
+        for pid, profile in self.profiles.items():
+            if pid not in self._history_names:
+                history.add_option(Option(profile["name"], id=pid))
+            elif self._history_names[pid] != profile["name"]:
+                history.replace_option_prompt(pid, profile["name"])
+        self._history_names = names
+
+        self._history_card.set_class(bool(self.profiles), "has-history")
+        if not self.profiles:
             self.current_profile_id = None
-            self.query_one("#delete-btn").remove_class("visible")
+            self._delete_btn.remove_class("visible")
+
+    async def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        pid = event.option.id
+        if not pid:
+            return
 
-    async def on_list_view_selected(self, event: ListView.Selected) -> None:
-        if not event.item or not event.item.id:
+        # The first click already filled the form; a second click on the same profile just connects.
+        now = time.monotonic()
+        if pid == self._last_click_id and now - self._last_click_time < self.DOUBLE_CLICK_SECONDS:
+            self._last_click_id = None
+            await self._do_connect()
             return
+        self._last_click_id = pid
+        self._last_click_time = now
 
-        pid = event.item.id.replace("prof-", "")
         self.current_profile_id = pid
         profile = self.profiles.get(pid)
 
         if profile:
-            self.query_one("#profile-name-input", Input).value = profile.get("name", "")
-            self.query_one("#host-input", Input).value = profile.get("host", "127.0.0.1")
-            self.query_one("#port-input", Input).value = str(profile.get("port", "6379"))
-            self.query_one("#db-input", Input).value = str(profile.get("db", "0"))
-            self.query_one("#password-input", Input).value = profile.get("password") or ""
-            self.query_one("#save-secrets-checkbox", Checkbox).value = bool(
+            self._inputs["profile-name-input"].value = profile.get("name", "")
+            self._inputs["host-input"].value = profile.get("host", "127.0.0.1")
+            self._inputs["port-input"].value = str(profile.get("port", "6379"))
+            self._inputs["db-input"].value = str(profile.get("db", "0"))
+            self._inputs["password-input"].value = profile.get("password") or ""
+            self._checkboxes["save-secrets-checkbox"].value = bool(
                 profile.get("save_secrets")
                 or profile.get("password")
                 or profile.get("sentinel_password")
                 or profile.get("ssh_password")
             )
-            self.query_one("#use-cluster-checkbox", Checkbox).value = profile.get("use_cluster", False)
+            self._checkboxes["use-cluster-checkbox"].value = profile.get("use_cluster", False)
             use_sentinel = profile.get("use_sentinel", False)
-            sentinel_checkbox = self.query_one("#use-sentinel-checkbox", Checkbox)
+            sentinel_checkbox = self._checkboxes["use-sentinel-checkbox"]
             sentinel_checkbox.value = use_sentinel
-            self.query_one("#sentinel-host-input", Input).value = profile.get("sentinel_host") or ""
-            self.query_one("#sentinel-port-input", Input).value = str(profile.get("sentinel_port") or 26379)
-            self.query_one("#sentinel-nodes-input", Input).value = profile.get("sentinel_nodes") or ""
-            self.query_one("#sentinel-master-input", Input).value = profile.get("sentinel_master_name") or ""
-            self.query_one("#sentinel-password-input", Input).value = profile.get("sentinel_password") or ""
+            self._inputs["sentinel-host-input"].value = profile.get("sentinel_host") or ""
+            self._inputs["sentinel-port-input"].value = str(profile.get("sentinel_port") or 26379)
+            self._inputs["sentinel-nodes-input"].value = profile.get("sentinel_nodes") or ""
+            self._inputs["sentinel-master-input"].value = profile.get("sentinel_master_name") or ""
+            self._inputs["sentinel-password-input"].value = profile.get("sentinel_password") or ""
 
             use_ssh = profile.get("use_ssh", False)
-            checkbox = self.query_one("#use-ssh-checkbox", Checkbox)
+            checkbox = self._checkboxes["use-ssh-checkbox"]
             checkbox.value = use_ssh
 
             # The on_checkbox_changed will show/hide the card, but let's set values anyway
-            self.query_one("#ssh-host-input", Input).value = profile.get("ssh_host") or ""
-            self.query_one("#ssh-port-input", Input).value = str(profile.get("ssh_port") or 22)
-            self.query_one("#ssh-user-input", Input).value = profile.get("ssh_user") or ""
-            self.query_one("#ssh-password-input", Input).value = profile.get("ssh_password") or ""
-            self.query_one("#ssh-key-input", Input).value = profile.get("ssh_private_key") or ""
+            self._inputs["ssh-host-input"].value = profile.get("ssh_host") or ""
+            self._inputs["ssh-port-input"].value = str(profile.get("ssh_port") or 22)
+            self._inputs["ssh-user-input"].value = profile.get("ssh_user") or ""
+            self._inputs["ssh-password-input"].value = profile.get("ssh_password") or ""
+            self._inputs["ssh-key-input"].value = profile.get("ssh_private_key") or ""
 
-            self.query_one("#delete-btn").add_class("visible")
-
-        now = time.time()
-        last_click_id = getattr(self, "_last_click_id", None)
-        last_click_time = getattr(self, "_last_click_time", 0.0)
-
-        if last_click_id == pid and (now - last_click_time) < 0.5:
-            # Double click detected
-            await self._do_connect()
-        else:
-            self._last_click_id = pid
-            self._last_click_time = now
+            self._delete_btn.add_class("visible")
 
     def _clear_form(self) -> None:
         """Clear the form for a new connection."""
         self.current_profile_id = None
-        self.query_one("#profile-name-input", Input).value = ""
-        self.query_one("#host-input", Input).value = "127.0.0.1"
-        self.query_one("#port-input", Input).value = "6379"
-        self.query_one("#db-input", Input).value = "0"
-        self.query_one("#password-input", Input).value = ""
-        self.query_one("#save-secrets-checkbox", Checkbox).value = False
-        self.query_one("#use-cluster-checkbox", Checkbox).value = False
-        self.query_one("#use-sentinel-checkbox", Checkbox).value = False
-        self.query_one("#sentinel-host-input", Input).value = ""
-        self.query_one("#sentinel-port-input", Input).value = "26379"
-        self.query_one("#sentinel-nodes-input", Input).value = ""
-        self.query_one("#sentinel-master-input", Input).value = ""
-        self.query_one("#sentinel-password-input", Input).value = ""
-
-        checkbox = self.query_one("#use-ssh-checkbox", Checkbox)
+        self._inputs["profile-name-input"].value = ""
+        self._inputs["host-input"].value = "127.0.0.1"
+        self._inputs["port-input"].value = "6379"
+        self._inputs["db-input"].value = "0"
+        self._inputs["password-input"].value = ""
+        self._checkboxes["save-secrets-checkbox"].value = False
+        self._checkboxes["use-cluster-checkbox"].value = False
+        self._checkboxes["use-sentinel-checkbox"].value = False
+        self._inputs["sentinel-host-input"].value = ""
+        self._inputs["sentinel-port-input"].value = "26379"
+        self._inputs["sentinel-nodes-input"].value = ""
+        self._inputs["sentinel-master-input"].value = ""
+        self._inputs["sentinel-password-input"].value = ""
+
+        checkbox = self._checkboxes["use-ssh-checkbox"]
         checkbox.value = False
 
-        self.query_one("#ssh-host-input", Input).value = ""
-        self.query_one("#ssh-port-input", Input).value = "22"
-        self.query_one("#ssh-user-input", Input).value = ""
-        self.query_one("#ssh-password-input", Input).value = ""
-        self.query_one("#ssh-key-input", Input).value = ""
+        self._inputs["ssh-host-input"].value = ""
+        self._inputs["ssh-port-input"].value = "22"
+        self._inputs["ssh-user-input"].value = ""
+        self._inputs["ssh-password-input"].value = ""
+        self._inputs["ssh-key-input"].value = ""
 
-        self.query_one("#delete-btn").remove_class("visible")
+        self._delete_btn.remove_class("visible")
 
         # Deselect any item in history list
-        list_view = self.query_one("#history-list", ListView)
-        list_view.index = None
+        self._history_list.highlighted = None
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "connect-btn":
@@ -394,91 +429,43 @@ class ConnectScreen(Screen):
         await self._do_connect()
 
     def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
-        if event.checkbox.id == "use-ssh-checkbox":
-            ssh_card = self.query_one("#ssh-card")
-            if event.value:
-                ssh_card.add_class("visible")
-            else:
-                ssh_card.remove_class("visible")
-        elif event.checkbox.id == "use-sentinel-checkbox":
-            sentinel_card = self.query_one("#sentinel-card")
-            if event.value:
-                sentinel_card.add_class("visible")
-            else:
-                sentinel_card.remove_class("visible")
-
-    def _build_profile_from_inputs(self) -> ConnectionProfile:
-        name = self.query_one("#profile-name-input", Input).value.strip() or ""
-        host = self.query_one("#host-input", Input).value.strip() or "127.0.0.1"
-        port_str = self.query_one("#port-input", Input).value.strip() or "6379"
-        db_str = self.query_one("#db-input", Input).value.strip() or "0"
-        password = self.query_one("#password-input", Input).value
-        save_secrets = self.query_one("#save-secrets-checkbox", Checkbox).value
-        use_cluster = self.query_one("#use-cluster-checkbox", Checkbox).value
-        use_sentinel = self.query_one("#use-sentinel-checkbox", Checkbox).value
-        use_ssh = self.query_one("#use-ssh-checkbox", Checkbox).value
-
-        try:
-            port = int(port_str)
-        except ValueError:
-            port = 6379
-        try:
-            db = int(db_str)
-        except ValueError:
-            db = 0
-
-        ssh_host = None
-        ssh_port = 22
-        ssh_user = None
-        ssh_password = None
-        ssh_private_key = None
-        sentinel_host = None
-        sentinel_port = 26379
-        sentinel_nodes = None
-        sentinel_master_name = None
-        sentinel_password = None
-
-        if use_sentinel:
-            sentinel_host = self.query_one("#sentinel-host-input", Input).value.strip() or None
+        card = self._option_cards.get(event.checkbox.id or "")
+        if card is not None:
+            card.set_class(event.value, "visible")
+
+    def _read_fields(self, fields: tuple[tuple[str, str, object, type | None], ...], enabled: bool = True) -> dict:
+        """Read one section of the form; a disabled section yields its defaults."""
+        values = {}
+        for key, input_id, default, parse in fields:
+            if not enabled:
+                values[key] = default
+                continue
+            raw = self._inputs[input_id].value
+            if parse is None:  # Secrets are kept verbatim; whitespace may be intentional.
+                values[key] = raw or default
+                continue
+            raw = raw.strip()
             try:
-                sentinel_port = int(self.query_one("#sentinel-port-input", Input).value.strip() or "26379")
+                values[key] = parse(raw) if raw else default
             except ValueError:
-                sentinel_port = 26379
-            sentinel_nodes = self.query_one("#sentinel-nodes-input", Input).value.strip() or None
-            sentinel_master_name = self.query_one("#sentinel-master-input", Input).value.strip() or None
-            sentinel_password = self.query_one("#sentinel-password-input", Input).value or None
+                values[key] = default
+        return values
 
-        if use_ssh:
-            ssh_host = self.query_one("#ssh-host-input", Input).value.strip() or None
-            try:
-                ssh_port = int(self.query_one("#ssh-port-input", Input).value.strip() or "22")
-            except ValueError:
-                ssh_port = 22
-            ssh_user = self.query_one("#ssh-user-input", Input).value.strip() or None
-            ssh_password = self.query_one("#ssh-password-input", Input).value or None
-            ssh_private_key = self.query_one("#ssh-key-input", Input).value.strip() or None
-
-        profile: ConnectionProfile = {
-            "name": name,
-            "host": host,
-            "port": port,
-            "db": db,
-            "password": password or None,
-            "save_secrets": save_secrets,
-            "use_cluster": use_cluster,
-            "use_sentinel": use_sentinel,
-            "sentinel_nodes": sentinel_nodes,
-            "sentinel_host": sentinel_host,
-            "sentinel_port": sentinel_port,
-            "sentinel_master_name": sentinel_master_name,
-            "sentinel_password": sentinel_password,
-            "use_ssh": use_ssh,
-            "ssh_host": ssh_host,
-            "ssh_port": ssh_port,
-            "ssh_user": ssh_user,
-            "ssh_password": ssh_password,
-            "ssh_private_key": ssh_private_key,
-        }
+    def _build_profile_from_inputs(self) -> ConnectionProfile:
+        use_sentinel = self._checkboxes["use-sentinel-checkbox"].value
+        use_ssh = self._checkboxes["use-ssh-checkbox"].value
+        profile = cast(
+            ConnectionProfile,
+            {
+                **self._read_fields(self._BASE_FIELDS),
+                "save_secrets": self._checkboxes["save-secrets-checkbox"].value,
+                "use_cluster": self._checkboxes["use-cluster-checkbox"].value,
+                "use_sentinel": use_sentinel,
+                **self._read_fields(self._SENTINEL_FIELDS, use_sentinel),
+                "use_ssh": use_ssh,
+                **self._read_fields(self._SSH_FIELDS, use_ssh),
+            },
+        )
 
         if self.current_profile_id:
             profile["id"] = self.current_profile_id
@@ -495,17 +482,26 @@ class ConnectScreen(Screen):
             stored["ssh_password"] = None
         return stored
 
+    def _is_saved(self, stored: ConnectionProfile) -> bool:
+        """Return True if ``stored`` matches the saved profile with the same ID exactly."""
+        known = self.profiles.get(stored.get("id") or "")
+        if known is None:
+            return False
+        # save_connection fills in a missing name the same way.
+        name = stored.get("name") or f"{stored.get('host', '127.0.0.1')}:{stored.get('port', 6379)}"
+        return known == {**stored, "name": name}
+
     async def _do_save(self) -> None:
         profile = self._build_profile_from_inputs()
         validation_error = self._validate_profile(profile)
         if validation_error:
-            error_label = self.query_one("#connect-error", Static)
+            error_label = self._error_label
             error_label.update(f"⚠️ {validation_error}")
             error_label.add_class("visible")
             return
 
-        saved_profile, _, persisted = save_connection(self._profile_for_storage(profile))
-        error_label = self.query_one("#connect-error", Static)
+        saved_profile, profiles, persisted = save_connection(self._profile_for_storage(profile))
+        error_label = self._error_label
         if not persisted:
             error_label.update("❌ Failed to save connection profile")
             error_label.add_class("visible")
@@ -515,12 +511,12 @@ class ConnectScreen(Screen):
         error_label.remove_class("visible")
         # Use the returned profile directly — its ID is guaranteed to be correct
         self.current_profile_id = saved_profile.get("id")
-        await self._refresh_history()
+        await self._refresh_history(profiles)
 
     async def _do_delete(self) -> None:
         if self.current_profile_id:
-            _, persisted = delete_connection(self.current_profile_id)
-            error_label = self.query_one("#connect-error", Static)
+            profiles, persisted = delete_connection(self.current_profile_id)
+            error_label = self._error_label
             if not persisted:
                 error_label.update("❌ Failed to delete connection profile")
                 error_label.add_class("visible")
@@ -529,7 +525,7 @@ class ConnectScreen(Screen):
             error_label.update("")
             error_label.remove_class("visible")
             self._clear_form()
-            await self._refresh_history()
+            await self._refresh_history(profiles)
 
     @staticmethod
     def _is_valid_host(host: str) -> bool:
@@ -628,14 +624,10 @@ class ConnectScreen(Screen):
         return None
 
     async def _do_connect(self) -> None:
-        import asyncio
-
-        from tuiredis.redis_client import RedisClient
-
         profile = self._build_profile_from_inputs()
 
-        error_label = self.query_one("#connect-error", Static)
-        connect_btn = self.query_one("#connect-btn", Button)
+        error_label = self._error_label
+        connect_btn = self._connect_btn
 
         # Fast client-side validation before touching the network
         validation_error = self._validate_profile(profile)
@@ -678,14 +670,12 @@ class ConnectScreen(Screen):
             error_label.update("")
             error_label.remove_class("visible")
 
-            # Auto-save successful connections; use the returned profile for its ID.
-            saved_profile, _, persisted = save_connection(self._profile_for_storage(profile))
-            if persisted:
-                self.current_profile_id = saved_profile.get("id")
-                await self._refresh_history()
-            elif not persisted:
-                error_label.update("⚠️ Connected, but failed to save connection profile")
-                error_label.add_class("visible")
+            # Auto-save successful connections in the background while the main screen opens.
+            # Reconnecting to an unchanged saved profile (e.g. Save, then Connect) has nothing to write.
+            stored = self._profile_for_storage(profile)
+            save_task = None
+            if not self._is_saved(stored):
+                save_task = asyncio.create_task(asyncio.to_thread(save_connection, stored))
 
             self.app.redis_client = client  # type: ignore[attr-defined]
 
@@ -695,6 +685,16 @@ class ConnectScreen(Screen):
                 main_screen.refresh_connection()
 
             self.app.push_screen("main")
+
+            if save_task is not None:
+                # Use the returned profile for its ID.
+                saved_profile, profiles, persisted = await save_task
+                if persisted:
+                    self.current_profile_id = saved_profile.get("id")
+                    await self._refresh_history(profiles)
+                else:
+                    error_label.update("⚠️ Connected, but failed to save connection profile")
+                    error_label.add_class("visible")
         else:
             error_label.update(f"❌ {profile['host']}:{profile['port']} - {err_msg}")
             error_label.add_class("visible")
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import fnmatch
 import os
+import re
 import signal
 import subprocess
 import sys
@@ -14,6 +15,7 @@ from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen, Screen
+from textual.timer import Timer
 from textual.widgets import Button, Footer, Header, Input, Select, Static, TabbedContent, TabPane
 
 from tuiredis.screens.new_key_modal import NewKeyModal
@@ -95,13 +97,21 @@ class MainScreen(Screen):
         self._iredis_proc: subprocess.Popen | None = None  # suspended iredis session
         self._iredis_db: int | None = None  # DB index when iredis was started
         self._keys_request_id = 0
+        # Set while a key load runs; later requests are folded into one follow-up load.
+        self._keys_load: asyncio.Future[None] | None = None
+        self._keys_reload_pending = False
+        self._keys_reload_db_options = False
         self._server_info_request_id = 0
         self._detail_request_id = 0
         self._load_more_request_id = 0
+        self._db_options_request_id = 0
+        self._db_options_counts: tuple[int, ...] = ()
         self._loading_states: set[str] = set()
         self._server_mode = "standalone"
         self._server_role = ""
         self._mode_notices_shown: set[str] = set()
+        self._search_timer: Timer | None = None
+        self._page_limit = 2000  # parsed from the limit box when it is submitted
 
     def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
         """Prevent priority bindings from quitting when typing in an Input."""
@@ -121,6 +131,11 @@ class MainScreen(Screen):
         Binding("ctrl+d", "bulk_delete", "Bulk Delete", show=False),
     ]
 
+    # Keystrokes in the search box within this window are filtered together.
+    SEARCH_DEBOUNCE_SECONDS = 0.15
+    # Pages larger than this are listed without TYPE lookups; types are filled in as branches are shown.
+    KEY_TYPES_PAGE_LIMIT = 5000
+
     DEFAULT_CSS = """
     MainScreen {
         layout: grid;
@@ -180,8 +195,10 @@ class MainScreen(Screen):
         yield Header(show_clock=True)
         with Horizontal(id="main-body"):
             with Vertical(id="left-panel"):
-                db_opts = [(f"DB {i}", str(i)) for i in range(16)]
-                yield Select(db_opts, value="0", id="db-select", allow_blank=False)
+                # Start on the client's DB: the Select's initial Changed must not switch databases.
+                current_db = self._get_client().db
+                db_opts = [(f"DB {i}", str(i)) for i in range(max(16, current_db + 1))]
+                yield Select(db_opts, value=str(current_db), id="db-select", allow_blank=False)
                 with Horizontal(id="search-row"):
                     yield Input(placeholder="🔍 Search...", id="search-box")
                     yield Input(value="2000", id="limit-box", type="integer")
@@ -198,16 +215,26 @@ class MainScreen(Screen):
 
     def on_mount(self) -> None:
         """Load keys on mount."""
+        # Widgets are composed once and never replaced; resolve them up front.
+        self._tree = self.query_one("#key-tree", KeyTree)
+        self._viewer = self.query_one("#value-viewer", ValueViewer)
+        self._detail = self.query_one("#key-detail", KeyDetail)
+        self._db_select = self.query_one("#db-select", Select)
+        self._server_info = self.query_one("#server-info", ServerInfo)
+        self._tabs = self.query_one("#center-panel", TabbedContent)
+        self._search_box = self.query_one("#search-box", Input)
+        self._status_bar = self.query_one("#status-bar", Static)
+
         client = self._get_client()
         if getattr(client, "use_cluster", False):
             self._server_mode = "cluster"
-        self._load_db_options(selected_db=client.db)
-        self.query_one("#db-select", Select).disabled = not self._supports_db_switching()
+        self._db_select.disabled = not self._supports_db_switching()
         asyncio.create_task(self._initialize_screen())
 
     async def _initialize_screen(self) -> None:
-        await self._load_server_info_async()
-        await self._load_keys_async()
+        # The DB list is filled from the INFO reply; only query the keyspace again if INFO failed.
+        info_loaded = await self._load_server_info_async()
+        await self._load_keys_async(refresh_db_options=not info_loaded)
 
     def _get_client(self):
         return self.app.redis_client  # type: ignore[attr-defined]
@@ -221,7 +248,7 @@ class MainScreen(Screen):
         if not self.is_mounted:
             return
 
-        status_bar = self.query_one("#status-bar", Static)
+        status_bar = self._status_bar
         if self._loading_states:
             status_bar.update(f"[dim]{message}[/]")
         else:
@@ -242,9 +269,9 @@ class MainScreen(Screen):
     def _apply_server_capabilities(self, info: dict) -> None:
         self._server_mode = str(info.get("redis_mode") or "standalone")
         self._server_role = str(info.get("role") or "")
-        self._load_db_options(selected_db=self._get_client().db)
+        self._load_db_options(selected_db=self._get_client().db, info=info)
 
-        db_select = self.query_one("#db-select", Select)
+        db_select = self._db_select
         db_select.disabled = not self._supports_db_switching()
 
         if self._server_mode == "cluster":
@@ -257,8 +284,8 @@ class MainScreen(Screen):
                 "sentinel",
                 "Sentinel mode detected: key browsing and value operations are unavailable on this connection.",
             )
-            self.query_one("#key-tree", KeyTree).load_keys([], {}, next_cursor=0, ttl_map={})
-            self.query_one("#value-viewer", ValueViewer).show_empty()
+            self._tree.load_keys([], {}, next_cursor=0, ttl_map={})
+            self._viewer.show_empty()
         elif self._server_role in {"slave", "replica"}:
             self._notify_mode_once(
                 "replica",
@@ -273,27 +300,25 @@ class MainScreen(Screen):
         client = self._get_client()
         self._server_mode = "cluster" if getattr(client, "use_cluster", False) else "standalone"
         self._server_role = ""
-        self._load_db_options(selected_db=client.db)
-        self.query_one("#db-select", Select).disabled = not self._supports_db_switching()
+        self._db_select.disabled = not self._supports_db_switching()
 
-        self.query_one("#value-viewer", ValueViewer).show_empty()
+        self._viewer.show_empty()
         self._virtual_keys.clear()  # stale virtual keys don't apply to new connection
 
         # Reset pagination/search
-        tree = self.query_one("#key-tree", KeyTree)
+        tree = self._tree
         tree._next_cursor = 0
 
         asyncio.create_task(self._refresh_connection_async())
 
     async def _refresh_connection_async(self) -> None:
-        await self._load_server_info_async()
-        await self._load_keys_async()
+        await self._initialize_screen()
 
     # ── Key Loading ──────────────────────────────────────────────
 
-    def _get_page_limit(self) -> int:
+    @staticmethod
+    def _parse_page_limit(val: str) -> int:
         try:
-            val = self.query_one("#limit-box", Input).value
             if not val:
                 return 2000
             limit = int(val)
@@ -301,38 +326,69 @@ class MainScreen(Screen):
         except Exception:
             return 2000
 
+    def _wants_key_types(self, page_limit: int) -> bool:
+        return getattr(self.app, "include_types", True) and page_limit <= self.KEY_TYPES_PAGE_LIMIT
+
     def _load_keys(self, pattern: str | None = None) -> None:
         asyncio.create_task(self._load_keys_async(pattern))
 
-    async def _load_keys_async(self, pattern: str | None = None) -> None:
-        self._keys_request_id += 1
-        request_id = self._keys_request_id
-        self._set_loading("keys", True, "Loading keys...")
+    async def _load_keys_async(self, pattern: str | None = None, refresh_db_options: bool = True) -> None:
+        """Load the first page of keys for *pattern* (default: the current pattern).
+
+        Calls made while a load is running discard its result and are folded into a
+        single follow-up load; they return once that load has finished.
+        """
         if pattern is not None:
             self._current_pattern = pattern
         elif not hasattr(self, "_current_pattern"):
             self._current_pattern = "*"
 
+        if self._keys_load is not None:
+            self._keys_request_id += 1  # the running load is now stale
+            self._keys_reload_pending = True
+            self._keys_reload_db_options = self._keys_reload_db_options or refresh_db_options
+            await asyncio.shield(self._keys_load)
+            return
+
+        self._keys_load = asyncio.get_running_loop().create_future()
+        try:
+            await self._load_keys_page_async(refresh_db_options)
+            while self._keys_reload_pending:
+                refresh_db_options = self._keys_reload_db_options
+                self._keys_reload_pending = self._keys_reload_db_options = False
+                await self._load_keys_page_async(refresh_db_options)
+        finally:
+            self._keys_load.set_result(None)
+            self._keys_load = None
+
+    async def _load_keys_page_async(self, refresh_db_options: bool) -> None:
+        self._keys_request_id += 1
+        request_id = self._keys_request_id
+        self._set_loading("keys", True, "Loading keys...")
+
         if not self._supports_data_browsing():
-            self.query_one("#key-tree", KeyTree).load_keys([], {}, next_cursor=0, ttl_map={})
+            self._tree.load_keys([], {}, next_cursor=0, ttl_map={})
             self._set_loading("keys", False, "")
             return
 
+        page_limit = self._page_limit
         try:
             next_cursor, keys, key_types, ttl_map = await asyncio.to_thread(
                 self._fetch_keys_payload,
                 self._current_pattern,
-                self._get_page_limit(),
+                page_limit,
+                self._wants_key_types(page_limit),
             )
             if request_id != self._keys_request_id or not self.is_mounted:
                 return
 
-            tree = self.query_one("#key-tree", KeyTree)
+            tree = self._tree
             tree.load_keys(keys, key_types, next_cursor=next_cursor, ttl_map=ttl_map)
-            self._load_db_options()
+            if refresh_db_options:
+                await self._load_db_options_async()
         except Exception as e:
             if request_id == self._keys_request_id and self.is_mounted:
-                self.query_one("#key-tree", KeyTree).load_keys([], {}, next_cursor=0, ttl_map={})
+                self._tree.load_keys([], {}, next_cursor=0, ttl_map={})
                 self.notify(f"Failed to load keys: {e}", severity="error", timeout=4)
         finally:
             if request_id == self._keys_request_id:
@@ -342,20 +398,32 @@ class MainScreen(Screen):
         self,
         pattern: str,
         page_limit: int,
+        with_types: bool = True,
     ) -> tuple[int, list[str], dict[str, str], dict[str, int]]:
         client = self._get_client()
-        next_cursor, keys = client.scan_keys_paginated(cursor=0, pattern=pattern, count=page_limit)
+        key_types: dict[str, str] = {}
+        if with_types:
+            next_cursor, keys, key_types = client.scan_keys_paginated(
+                cursor=0, pattern=pattern, count=page_limit, with_types=True
+            )
+        else:
+            next_cursor, keys = client.scan_keys_paginated(cursor=0, pattern=pattern, count=page_limit)
 
-        for v_key in self._virtual_keys:
-            if fnmatch.fnmatch(v_key, pattern) and v_key not in keys:
-                keys.append(v_key)
+        if self._virtual_keys:
+            # Compile the glob once; dict.fromkeys below drops virtual keys the scan already returned.
+            matches = re.compile(fnmatch.translate(pattern)).match
+            keys.extend(v_key for v_key in self._virtual_keys if matches(v_key))
 
         keys = list(dict.fromkeys(keys))
-        key_types = client.get_types(keys)
+        untyped = [key for key in keys if key not in key_types] if with_types else []
+        if untyped:
+            key_types.update(client.get_types(untyped))
 
-        for v_key, v_type in self._virtual_keys.items():
-            if v_key in keys and key_types.get(v_key, "none") == "none":
-                key_types[v_key] = v_type
+        if self._virtual_keys:
+            shown = set(keys)
+            for v_key, v_type in self._virtual_keys.items():
+                if v_key in shown and key_types.get(v_key, "none") == "none":
+                    key_types[v_key] = v_type
 
         ttl_sample = keys[:2000]
         try:
@@ -365,44 +433,60 @@ class MainScreen(Screen):
 
         return next_cursor, keys, key_types, ttl_map
 
-    def _load_db_options(self, selected_db: int | None = None):
+    def _load_db_options(self, selected_db: int | None = None, info: dict | None = None) -> None:
+        asyncio.create_task(self._load_db_options_async(selected_db, info))
+
+    async def _load_db_options_async(self, selected_db: int | None = None, info: dict | None = None) -> None:
+        self._db_options_request_id += 1
+        request_id = self._db_options_request_id
         client = self._get_client()
-        keyspace = client.get_keyspace_info()
-        db_count = max(client.get_database_count(), (selected_db if selected_db is not None else client.db) + 1)
-        db_opts = []
-        for i in range(db_count):
-            count = keyspace.get(i, 0)
-            if count > 0:
-                label = f"DB {i} ({count})"
-            else:
-                label = f"DB {i}"
-            db_opts.append((label, str(i)))
+        try:
+            keyspace, db_count = await asyncio.to_thread(self._fetch_db_options_payload, info)
+        except Exception:
+            return
+        if request_id != self._db_options_request_id or not self.is_mounted:
+            return
+
+        db_count = max(db_count, (selected_db if selected_db is not None else client.db) + 1)
+        counts = tuple(keyspace.get(i, 0) for i in range(db_count))
 
         try:
-            select = self.query_one("#db-select", Select)
+            select = self._db_select
             target_val = str(selected_db if selected_db is not None else (select.value or client.db))
 
             with select.prevent(Select.Changed):
-                select.set_options(db_opts)
-                select.value = target_val
+                # Unchanged counts keep the current options rather than making the Select rebuild them.
+                if counts != self._db_options_counts:
+                    db_opts = [(f"DB {i} ({count})" if count else f"DB {i}", str(i)) for i, count in enumerate(counts)]
+                    select.set_options(db_opts)
+                    self._db_options_counts = counts
+                if select.value != target_val:
+                    select.value = target_val
         except Exception:
             pass
 
+    def _fetch_db_options_payload(self, info: dict | None = None) -> tuple[dict[int, int], int]:
+        client = self._get_client()
+        keyspace = client.get_keyspace_info(info) if info is not None else client.get_keyspace_info()
+        return keyspace, client.get_database_count()
+
     def _load_server_info(self):
         asyncio.create_task(self._load_server_info_async())
 
-    async def _load_server_info_async(self) -> None:
+    async def _load_server_info_async(self) -> bool:
+        """Fetch INFO and apply it; return True if this reply was applied."""
         self._server_info_request_id += 1
         request_id = self._server_info_request_id
         self._set_loading("server_info", True, "Loading server info...")
         try:
             info = await asyncio.to_thread(self._get_client().get_server_info)
             if request_id != self._server_info_request_id or not self.is_mounted:
-                return
-            self.query_one("#server-info", ServerInfo).update_info(info)
+                return False
+            self._server_info.update_info(info)
             self._apply_server_capabilities(info)
+            return True
         except Exception:
-            pass
+            return False
         finally:
             if request_id == self._server_info_request_id:
                 self._set_loading("server_info", False, "")
@@ -414,7 +498,7 @@ class MainScreen(Screen):
         self.notify("🔄 Refreshed", timeout=2)
 
     def action_focus_search(self) -> None:
-        self.query_one("#search-box", Input).focus()
+        self._search_box.focus()
 
     def action_new_key(self) -> None:
         self.app.push_screen(NewKeyModal(), self._on_new_key_created)
@@ -427,12 +511,12 @@ class MainScreen(Screen):
         key_type = result.key_type
         if not result.wrote_to_redis:
             self._virtual_keys[key] = key_type
-        self._load_keys()
+        self._tree.insert_key(key, key_type)
         self.notify(f"✨ Created {key_type} key: {key}", timeout=2)
-        self.query_one("#key-tree", KeyTree).post_message(KeyTree.KeySelected(key))
+        self._tree.post_message(KeyTree.KeySelected(key))
 
     def action_toggle_info(self) -> None:
-        tabs = self.query_one("#center-panel", TabbedContent)
+        tabs = self._tabs
         tabs.active = "tab-info" if tabs.active != "tab-info" else "tab-value"
 
     def action_open_iredis(self) -> None:
@@ -476,20 +560,6 @@ class MainScreen(Screen):
         else:
             _restarted_for_db = None
 
-        kwargs = client.client.connection_pool.connection_kwargs
-        actual_host = kwargs.get("host", client.host)
-        actual_port = kwargs.get("port", client.port)
-
-        # Construct secure connection URL
-        if client.password:
-            password = quote(client.password, safe="")
-            url = f"redis://:{password}@{actual_host}:{actual_port}/{client.db}"
-        else:
-            url = f"redis://{actual_host}:{actual_port}/{client.db}"
-
-        env = os.environ.copy()
-        env["IREDIS_URL"] = url
-
         with self.app.suspend():
             stdin_fd = sys.stdin.fileno()
 
@@ -501,7 +571,7 @@ class MainScreen(Screen):
                 # Start iredis in its own process group so Ctrl+Z only affects it
                 proc = subprocess.Popen(
                     [iredis_bin],
-                    env=env,
+                    env={**os.environ, "IREDIS_URL": self._iredis_url(client)},
                     preexec_fn=os.setpgrp,  # new process group, pgid == proc.pid
                 )
                 self._iredis_proc = proc
@@ -538,7 +608,7 @@ class MainScreen(Screen):
             signal.signal(signal.SIGTTOU, old_sigttou)
 
         # Show a hint in the status bar when iredis is suspended
-        status_bar = self.query_one("#status-bar", Static)
+        status_bar = self._status_bar
         if self._iredis_proc is not None:
             status_bar.update("[dim]IRedis session suspended — Ctrl+T to resume[/]")
         else:
@@ -547,6 +617,16 @@ class MainScreen(Screen):
         if _restarted_for_db is not None:
             self.notify(f"♻️ IRedis restarted (DB changed → DB {_restarted_for_db})", timeout=3)
 
+    @staticmethod
+    def _iredis_url(client) -> str:
+        """Build the connection URL for a new iredis session (only needed when one is started)."""
+        kwargs = client.client.connection_pool.connection_kwargs
+        host = kwargs.get("host", client.host)
+        port = kwargs.get("port", client.port)
+        password = client.password
+        auth = f":{quote(password, safe='')}@" if password else ""
+        return f"redis://{auth}{host}:{port}/{client.db}"
+
     def action_quit(self) -> None:
         client = self._get_client()
         client.disconnect()
@@ -584,21 +664,32 @@ class MainScreen(Screen):
                     with event.select.prevent(Select.Changed):
                         event.select.value = str(client.db)
                     return
-                self.query_one("#value-viewer", ValueViewer).show_empty()
+                self._viewer.show_empty()
                 self._virtual_keys.clear()  # virtual keys are DB-scoped
                 await self._load_keys_async()
                 self.notify(f"Switched to DB {new_db}", timeout=2)
 
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id == "search-box":
-            tree = self.query_one("#key-tree", KeyTree)
-            tree.filter_keys(event.value)
+            if self._search_timer is not None:
+                self._search_timer.stop()
+            self._search_timer = self.set_timer(self.SEARCH_DEBOUNCE_SECONDS, self._apply_search_filter)
+
+    def _apply_search_filter(self) -> None:
+        """Filter the key tree by the current search text."""
+        if self._search_timer is not None:
+            self._search_timer.stop()
+            self._search_timer = None
+        self._tree.filter_keys(self._search_box.value)
 
     async def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id == "limit-box":
+            self._page_limit = self._parse_page_limit(event.value)
             await self._load_keys_async()
-            self.notify(f"Keys reloaded (limit: {self._get_page_limit()})", timeout=2)
+            self.notify(f"Keys reloaded (limit: {self._page_limit})", timeout=2)
         elif event.input.id == "search-box":
+            if self._search_timer is not None:
+                self._apply_search_filter()  # catch the tree filter up with the submitted text
             pattern = f"*{event.value}*" if event.value else "*"
             await self._load_keys_async(pattern=pattern)
             self.notify(f"Search matching {pattern}", timeout=2)
@@ -611,7 +702,7 @@ class MainScreen(Screen):
                 "Key browsing is unavailable in sentinel mode.",
             )
             return
-        tree = self.query_one("#key-tree", KeyTree)
+        tree = self._tree
         if tree._next_cursor == 0:
             return
 
@@ -619,21 +710,20 @@ class MainScreen(Screen):
         request_id = self._load_more_request_id
         self._set_loading("load_more", True, "Loading more keys...")
         actual_pattern = getattr(self, "_current_pattern", "*")
+        page_limit = self._page_limit
         try:
             next_cursor, keys, key_types, ttl_map = await asyncio.to_thread(
                 self._fetch_load_more_keys_payload,
                 tree._next_cursor,
                 actual_pattern,
-                self._get_page_limit(),
+                page_limit,
+                self._wants_key_types(page_limit),
             )
             if request_id != self._load_more_request_id or not self.is_mounted:
                 return
 
-            if keys:
-                tree.append_keys(keys, key_types, next_cursor, ttl_map=ttl_map)
-            else:
-                tree._next_cursor = next_cursor
-                tree._rebuild_tree()
+            # An empty page only updates the Load More node.
+            tree.append_keys(keys, key_types, next_cursor, ttl_map=ttl_map)
         finally:
             if request_id == self._load_more_request_id:
                 self._set_loading("load_more", False, "")
@@ -643,26 +733,41 @@ class MainScreen(Screen):
         cursor: int,
         pattern: str,
         page_limit: int,
+        with_types: bool = True,
     ) -> tuple[int, list[str], dict[str, str], dict[str, int]]:
         client = self._get_client()
-        next_cursor, keys = client.scan_keys_paginated(cursor=cursor, pattern=pattern, count=page_limit)
+        key_types: dict[str, str] = {}
+        if with_types:
+            next_cursor, keys, key_types = client.scan_keys_paginated(
+                cursor=cursor, pattern=pattern, count=page_limit, with_types=True
+            )
+        else:
+            next_cursor, keys = client.scan_keys_paginated(cursor=cursor, pattern=pattern, count=page_limit)
         if not keys:
             return next_cursor, [], {}, {}
 
-        key_types = client.get_types(keys)
         try:
             ttl_map = client.get_ttls(keys[:2000])
         except Exception:
             ttl_map = {}
         return next_cursor, keys, key_types, ttl_map
 
+    async def on_key_tree_types_requested(self, event: KeyTree.TypesRequested) -> None:
+        """Fill in the types of keys that were listed without them once their branch is shown."""
+        try:
+            key_types = await asyncio.to_thread(self._get_client().get_types, event.keys)
+        except Exception:
+            return
+        if self.is_mounted:
+            self._tree.update_key_types(key_types)
+
     def on_key_tree_selection_changed(self, event: KeyTree.SelectionChanged) -> None:
         """Show selection count in the status bar."""
         n = len(event.selected_keys)
         if n == 0:
-            self.query_one("#status-bar", Static).update("")
+            self._status_bar.update("")
         else:
-            self.query_one("#status-bar", Static).update(
+            self._status_bar.update(
                 f"[bold yellow]☑ {n} key{'s' if n != 1 else ''} selected[/]  "
                 f"[dim]Ctrl+D to delete all selected[/]"
             )
@@ -675,15 +780,15 @@ class MainScreen(Screen):
                 "Key operations are unavailable in sentinel mode.",
             )
             return
-        tree = self.query_one("#key-tree", KeyTree)
+        tree = self._tree
         selected = tree.bulk_delete_selected()
         if not selected:
             self.notify("No keys selected — press Space on a key to select it", timeout=3)
             return
         deleted = await asyncio.to_thread(self._get_client().delete_keys_batch, list(selected))
-        self.query_one("#status-bar", Static).update("")
+        self._status_bar.update("")
         self.notify(f"🗑️ Deleted {deleted} key{'s' if deleted != 1 else ''}", timeout=3)
-        self.query_one("#value-viewer", ValueViewer).show_empty()
+        self._viewer.show_empty()
         await self._load_keys_async()
 
     async def on_key_tree_key_selected(self, event: KeyTree.KeySelected) -> None:
@@ -699,62 +804,41 @@ class MainScreen(Screen):
         request_id = self._detail_request_id
         self._set_loading("detail", True, f"Loading {key}...")
         try:
+            # The type listed in the tree lets metadata and value come back in one round trip.
             key_type, data, total_count, cursor, ttl, encoding, memory = await asyncio.to_thread(
                 self._fetch_key_details_payload,
                 key,
+                self._tree._key_types.get(key),
             )
             if request_id != self._detail_request_id or not self.is_mounted:
                 return
 
-            if key_type == "none" and hasattr(self, "_virtual_keys"):
-                # Check if it was a virtual key that hasn't been written to Redis yet
-                if key in self._virtual_keys:
-                    key_type = self._virtual_keys[key]
-                    data, total_count, cursor = self._get_value(key, key_type)
-
-            viewer = self.query_one("#value-viewer", ValueViewer)
+            viewer = self._viewer
             await viewer.show_value(key, key_type, data, total_count=total_count, cursor=cursor)
 
-            detail = self.query_one("#key-detail", KeyDetail)
+            detail = self._detail
             await detail.show_detail(key, key_type, ttl, encoding, memory)
 
-            tabs = self.query_one("#center-panel", TabbedContent)
+            tabs = self._tabs
             tabs.active = "tab-value"
         finally:
             if request_id == self._detail_request_id:
                 self._set_loading("detail", False, "")
 
-    def _fetch_key_details_payload(self, key: str) -> tuple[str, object, int | None, int, int, str, int | None]:
+    def _fetch_key_details_payload(
+        self, key: str, type_hint: str | None = None
+    ) -> tuple[str, object, int | None, int, int, str, int | None]:
         client = self._get_client()
-        key_type = client.get_type(key)
-        data, total_count, cursor = self._get_value(key, key_type)
-        ttl = client.get_ttl(key)
-        encoding = client.get_encoding(key)
-        memory = client.get_memory_usage(key)
+        key_type, ttl, encoding, memory, data, total_count, cursor = client.get_key_bundle(key, type_hint)
+        if key_type == "none" and key in self._virtual_keys:
+            # A key created in the UI that hasn't been written to Redis yet
+            key_type = self._virtual_keys[key]
+            data, total_count, cursor = self._get_value(key, key_type)
         return key_type, data, total_count, cursor, ttl, encoding, memory
 
     def _get_value(self, key: str, key_type: str) -> tuple:
         """Return (data, total_count, cursor). total_count is None for string keys."""
-        client = self._get_client()
-        if key_type == "string":
-            return client.get_string(key), None, 0
-        elif key_type == "list":
-            return client.get_list(key), client.get_list_count(key), 0
-        elif key_type == "hash":
-            total = client.get_hash_count(key)
-            if total <= client.DISPLAY_LIMIT:
-                return client.get_hash(key), total, 0
-            next_cursor, data = client.get_hash_page(key, cursor=0)
-            return data, total, next_cursor
-        elif key_type == "set":
-            total = client.get_set_count(key)
-            if total <= client.DISPLAY_LIMIT:
-                return client.get_set(key), total, 0
-            next_cursor, data = client.get_set_page(key, cursor=0)
-            return data, total, next_cursor
-        elif key_type == "zset":
-            return client.get_zset(key), client.get_zset_count(key), 0
-        return None, None, 0
+        return self._get_client().get_value(key, key_type)
 
     # ── Value Viewer Messages ────────────────────────────────────
 
@@ -764,7 +848,7 @@ class MainScreen(Screen):
             return
         client = self._get_client()
         if event.value_type == "string":
-            client.set_string(event.key, event.data)
+            await asyncio.to_thread(client.set_string, event.key, event.data)
             self.notify(f"✅ Saved {event.key}", timeout=2)
 
     async def on_value_viewer_member_added(self, event: ValueViewer.MemberAdded) -> None:
@@ -772,81 +856,41 @@ class MainScreen(Screen):
             self._notify_mode_once("sentinel-write", "Key operations are unavailable in sentinel mode.")
             return
         try:
-            key_type, data, total_count, cursor = await asyncio.to_thread(self._apply_member_add_and_reload, event)
-            viewer = self.query_one("#value-viewer", ValueViewer)
+            # The write and the refreshed first page share one round trip.
+            key_type, data, total_count, cursor = await asyncio.to_thread(
+                self._get_client().add_member_and_get_value, event.key, event.value_type, event.data
+            )
+            viewer = self._viewer
             await viewer.show_value(event.key, key_type, data, total_count=total_count, cursor=cursor)
             self.notify(f"✅ Saved to {event.key}", timeout=2)
         except Exception as e:
             self.notify(f"⚠️ Edit failed: {e}", severity="error", timeout=4)
 
-    def _apply_member_add_and_reload(self, event: ValueViewer.MemberAdded) -> tuple[str, object, int | None, int]:
-        client = self._get_client()
-        if event.value_type == "list":
-            idx, val = event.data
-            if idx is not None:
-                client.list_set(event.key, idx, val)
-            else:
-                client.list_push(event.key, val)
-        elif event.value_type == "hash":
-            field, value = event.data
-            client.hash_set(event.key, field, value)
-        elif event.value_type == "set":
-            client.set_add(event.key, event.data)
-        elif event.value_type == "zset":
-            member, score = event.data
-            client.zset_add(event.key, member, score)
-
-        key_type = client.get_type(event.key)
-        data, total_count, cursor = self._get_value(event.key, key_type)
-        return key_type, data, total_count, cursor
-
     async def on_value_viewer_member_deleted(self, event: ValueViewer.MemberDeleted) -> None:
         if not self._supports_data_browsing():
             self._notify_mode_once("sentinel-write", "Key operations are unavailable in sentinel mode.")
             return
         try:
-            key_type, data, total_count, cursor = await asyncio.to_thread(self._apply_member_delete_and_reload, event)
+            key_type, data, total_count, cursor = await asyncio.to_thread(
+                self._get_client().remove_member_and_get_value, event.key, event.value_type, event.data
+            )
             if key_type == "none":
                 # Deleted last element, key might be gone!
-                self.query_one("#value-viewer", ValueViewer).show_empty()
+                self._viewer.show_empty()
                 await self._load_keys_async()
             else:
-                viewer = self.query_one("#value-viewer", ValueViewer)
+                viewer = self._viewer
                 await viewer.show_value(event.key, key_type, data, total_count=total_count, cursor=cursor)
             self.notify(f"🗑️ Deleted from {event.key}", timeout=2)
         except Exception as e:
             self.notify(f"⚠️ Delete failed: {e}", severity="error", timeout=4)
 
-    def _apply_member_delete_and_reload(
-        self,
-        event: ValueViewer.MemberDeleted,
-    ) -> tuple[str, object | None, int | None, int]:
-        client = self._get_client()
-        if event.value_type == "list":
-            idx, val = event.data
-            if idx is not None:
-                client.list_delete_by_index(event.key, idx)
-            else:
-                client.list_remove(event.key, val, 1)
-        elif event.value_type == "hash":
-            client.hash_delete(event.key, event.data)
-        elif event.value_type == "set":
-            client.set_remove(event.key, event.data)
-        elif event.value_type == "zset":
-            client.zset_remove(event.key, event.data)
-
-        key_type = client.get_type(event.key)
-        if key_type == "none":
-            return key_type, None, None, 0
-        data, total_count, cursor = self._get_value(event.key, key_type)
-        return key_type, data, total_count, cursor
-
     async def on_value_viewer_load_more(self, event: ValueViewer.LoadMore) -> None:
         """Fetch the next page of list/zset/hash/set data and append it to the viewer."""
         if not self._supports_data_browsing():
             self._notify_mode_once("sentinel-browse", "Key browsing is unavailable in sentinel mode.")
             return
-        viewer = self.query_one("#value-viewer", ValueViewer)
+        viewer = self._viewer
         try:
             new_data, total, next_cursor = await asyncio.to_thread(self._fetch_value_viewer_page, event)
             viewer.append_rows(new_data, total, next_cursor=next_cursor)
@@ -889,7 +933,7 @@ class MainScreen(Screen):
             del self._virtual_keys[event.key]
 
         await self._load_keys_async()
-        viewer = self.query_one("#value-viewer", ValueViewer)
+        viewer = self._viewer
         viewer.show_empty()
         self.notify(f"🗑️  Deleted {event.key}", timeout=2)
 
@@ -914,10 +958,10 @@ class MainScreen(Screen):
             self._fetch_key_details_payload,
             event.new_key,
         )
-        viewer = self.query_one("#value-viewer", ValueViewer)
+        viewer = self._viewer
         await viewer.show_value(event.new_key, key_type, data, total_count=total_count, cursor=cursor)
 
-        detail = self.query_one("#key-detail", KeyDetail)
+        detail = self._detail
         await detail.show_detail(event.new_key, key_type, ttl, encoding, memory)
 
     async def on_key_detail_ttl_set(self, event: KeyDetail.TtlSet) -> None:
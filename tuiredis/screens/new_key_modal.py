@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.message import Message
@@ -166,7 +168,7 @@ class NewKeyModal(ModalScreen):
         pressed_id = radio_set.pressed_button.id if radio_set.pressed_button else "nk-rb-string"
         key_type = self._NK_TYPE_MAP.get(pressed_id, "string")
 
-        if client.key_exists(name):
+        if await asyncio.to_thread(client.key_exists, name):
             self.notify(
                 f"⚠️  Key '{name}' already exists — select it from the tree to edit",
                 severity="warning",
@@ -179,20 +181,20 @@ class NewKeyModal(ModalScreen):
             if key_type == "string":
                 val = self.query_one("#nk-str-val", Input).value
                 if val:
-                    client.set_string(name, val)
+                    await asyncio.to_thread(client.set_string, name, val)
                     wrote_to_redis = True
 
             elif key_type == "list":
                 val = self.query_one("#nk-list-val", Input).value.strip()
                 if val:
-                    client.list_push(name, val)
+                    await asyncio.to_thread(client.list_push, name, val)
                     wrote_to_redis = True
 
             elif key_type == "hash":
                 field = self.query_one("#nk-hash-fld", Input).value.strip()
                 val = self.query_one("#nk-hash-val", Input).value.strip()
                 if field and val:
-                    client.hash_set(name, field, val)
+                    await asyncio.to_thread(client.hash_set, name, field, val)
                     wrote_to_redis = True
                 elif field or val:
                     self.notify(
@@ -204,7 +206,7 @@ class NewKeyModal(ModalScreen):
             elif key_type == "set":
                 val = self.query_one("#nk-set-val", Input).value.strip()
                 if val:
-                    client.set_add(name, val)
+                    await asyncio.to_thread(client.set_add, name, val)
                     wrote_to_redis = True
 
             elif key_type == "zset":
@@ -220,7 +222,7 @@ class NewKeyModal(ModalScreen):
                             timeout=4,
                         )
                         return
-                    client.zset_add(name, member, score)
+                    await asyncio.to_thread(client.zset_add, name, member, score)
                     wrote_to_redis = True
                 elif member or score_str:
                     self.notify(
@@ -62,7 +62,9 @@ class CommandInput(Widget):
         command = event.value.strip()
         if not command:
             return
-        self._history.append(command)
+        # Repeating the last command should not add another step to walk back through.
+        if not self._history or self._history[-1] != command:
+            self._history.append(command)
         self._history_index = -1
         event.input.value = ""
         self.post_message(self.CommandSubmitted(command))
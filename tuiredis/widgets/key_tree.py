@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right, insort
+from heapq import merge
+from itertools import groupby
+from operator import itemgetter
+
 from textual.message import Message
 from textual.widgets import Tree
-from textual.widgets._tree import TreeNode
+from textual.widgets._tree import NodeID, TreeNode
 
 
 class KeyTree(Tree):
@@ -24,6 +29,13 @@ class KeyTree(Tree):
 
         pass
 
+    class TypesRequested(Message):
+        """Emitted when an expanded branch shows keys whose type is not known yet."""
+
+        def __init__(self, keys: list[str]) -> None:
+            self.keys = keys
+            super().__init__()
+
     class SelectionChanged(Message):
         """Emitted when the multi-selection set changes."""
 
@@ -46,10 +58,20 @@ class KeyTree(Tree):
         self._keys: list[str] = []
         self._keys_set: set[str] = set()
         self._key_types: dict[str, str] = {}
+        self._types_requested: set[str] = set()  # untyped keys already asked for via TypesRequested
         self._ttl_map: dict[str, int] = {}  # key → TTL (-1 no expiry, -2 missing)
         self._filter: str = ""
         self._next_cursor: int = 0
         self._selected_keys: set[str] = set()  # multi-select
+        # Sorted split form of every key, reused by unfiltered rebuilds until the key list changes.
+        self._sorted_entries: list[tuple[str, ...]] | None = None
+        # Collapsed branch id → (entries, depth, prefix) still to be built.
+        self._pending_children: dict[NodeID, tuple[list[tuple[str, ...]], int, str]] = {}
+        # Top-level name → (sorted split keys, node), so appended pages only touch their own groups.
+        self._top_groups: dict[str, tuple[list[tuple[str, ...]], TreeNode]] = {}
+        self._top_names: list[str] = []
+        self._shown_count = 0
+        self._load_more_node: TreeNode | None = None
 
     def load_keys(
         self,
@@ -61,7 +83,9 @@ class KeyTree(Tree):
         """Load a list of keys into the tree, grouped by separator."""
         self._keys = keys
         self._keys_set = set(keys)
+        self._sorted_entries = None
         self._key_types = key_types or {}
+        self._types_requested.clear()
         self._ttl_map = ttl_map or {}
         self._next_cursor = next_cursor
         self._selected_keys.clear()
@@ -79,15 +103,55 @@ class KeyTree(Tree):
         next_cursor: int,
         ttl_map: dict[str, int] | None = None,
     ) -> None:
-        """Append new keys (from pagination) and rebuild the tree."""
+        """Append new keys (from pagination) without rebuilding the existing nodes.
+
+        Only the top-level groups that receive new keys are rebuilt, in place.
+        """
         new_keys = [key for key in keys if key not in self._keys_set]
         self._keys.extend(new_keys)
+        self._sorted_entries = None
         self._keys_set.update(new_keys)
         self._key_types.update(key_types)
         if ttl_map:
             self._ttl_map.update(ttl_map)
         self._next_cursor = next_cursor
-        self._rebuild_tree()
+        with self.app.batch_update():
+            self._update_load_more_node()
+            self._insert_keys(new_keys)
+
+    def insert_key(self, key: str, key_type: str) -> None:
+        """Show a single newly created key without rescanning or rebuilding the tree."""
+        self._key_types[key] = key_type
+        if key in self._keys_set:
+            return
+        self._keys.append(key)
+        self._keys_set.add(key)
+        self._sorted_entries = None
+        with self.app.batch_update():
+            self._insert_keys([key])
+
+    def _insert_keys(self, new_keys: list[str]) -> None:
+        """Merge keys not yet in the tree into their root-level groups, rebuilding only those groups."""
+        if self._filter:
+            new_keys = [k for k in new_keys if self._filter in k.lower()]
+        if not new_keys:
+            return
+        entries = sorted(tuple(key.split(self.SEPARATOR)) for key in new_keys)
+        for name, group_iter in groupby(entries, key=itemgetter(0)):
+            group = list(group_iter)
+            existing = self._top_groups.get(name)
+            if existing is None:
+                insort(self._top_names, name)
+            else:
+                group = list(merge(existing[0], group))
+                existing[1].remove()
+            index = bisect_right(self._top_names, name)
+            before = self._load_more_node
+            if index < len(self._top_names):
+                before = self._top_groups[self._top_names[index]][1]
+            self._add_top_group(name, group, before=before)
+        self._shown_count += len(new_keys)
+        self._update_root_label()
 
     def filter_keys(self, pattern: str) -> None:
         """Filter the displayed keys by a substring match."""
@@ -103,37 +167,54 @@ class KeyTree(Tree):
 
     def _rebuild_tree(self) -> None:
         """Rebuild the tree from the current key list and filter."""
-        self.clear()
-        self.root.expand()
+        # Clearing and re-adding every node would otherwise invalidate the tree once per node.
+        with self.app.batch_update():
+            self.clear()
+            self._pending_children.clear()
+            self.root.expand()
 
-        filtered = self._keys
-        if self._filter:
-            filtered = [k for k in self._keys if self._filter in k.lower()]
-
-        self._filtered_set = set(filtered)
-
-        # Build hierarchy with leaf-count tracking in a single pass.
-        tree_data: dict = {}
-        for key in filtered:
-            parts = key.split(self.SEPARATOR)
-            node = tree_data
-            path_nodes = []
-            for part in parts:
-                if part not in node:
-                    node[part] = [{}, 0]
-                path_nodes.append(node[part])
-                node = node[part][0]
-            for ancestor in path_nodes:
-                ancestor[1] += 1
-
-        self._build_nodes(self.root, tree_data, prefix="")
-        self.root.label = f"🔑 Keys ({len(filtered)})"
+            self._top_groups.clear()
+            self._top_names = []
+            self._load_more_node = None
 
+            # Sorted split keys let every tree level be grouped in a single linear pass.
+            if self._filter:
+                filtered = [k for k in self._keys if self._filter in k.lower()]
+                entries = sorted(tuple(key.split(self.SEPARATOR)) for key in filtered)
+            else:
+                if self._sorted_entries is None:
+                    self._sorted_entries = sorted(tuple(key.split(self.SEPARATOR)) for key in self._keys)
+                entries = self._sorted_entries
+            for name, group_iter in groupby(entries, key=itemgetter(0)):
+                self._top_names.append(name)
+                self._add_top_group(name, list(group_iter))
+            self._shown_count = len(entries)
+            self._update_root_label()
+            self._update_load_more_node()
+
+    def _add_top_group(self, name: str, group: list[tuple[str, ...]], before: TreeNode | None = None) -> None:
+        """Add the root-level node for *name* and remember it for later appends."""
+        node = self._add_group(self.root, name, group, depth=0, prefix="", before=before)
+        self._top_groups[name] = (group, node)
+
+    def _update_root_label(self) -> None:
+        label = f"🔑 Keys ({self._shown_count})"
         if self._selected_keys:
-            self.root.label = f"🔑 Keys ({len(filtered)})  ☑ {len(self._selected_keys)} selected"
+            label = f"{label}  ☑ {len(self._selected_keys)} selected"
+        self.root.label = label
 
-        if self._next_cursor != 0:
-            self.root.add_leaf(f"📂 Load More... [{self._next_cursor}]", data="_LOAD_MORE_")
+    def _update_load_more_node(self) -> None:
+        """Keep the trailing Load More node in step with the scan cursor."""
+        if self._next_cursor == 0:
+            if self._load_more_node is not None:
+                self._load_more_node.remove()
+                self._load_more_node = None
+            return
+        label = f"📂 Load More... [{self._next_cursor}]"
+        if self._load_more_node is None:
+            self._load_more_node = self.root.add_leaf(label, data="_LOAD_MORE_")
+        else:
+            self._load_more_node.set_label(label)
 
     def _get_ttl_suffix(self, key: str) -> str:
         """Return a TTL indicator suffix for a key."""
@@ -146,24 +227,74 @@ class KeyTree(Tree):
             return f" ⏱{ttl}s"
         return f" ⏱{ttl // 3600}h"
 
-    def _build_nodes(self, parent: TreeNode, data: dict, prefix: str) -> None:
-        """Recursively build tree nodes."""
-        for name, (children, leaf_count) in sorted(data.items()):
-            full_key = f"{prefix}{self.SEPARATOR}{name}" if prefix else name
-            is_key = full_key in self._filtered_set
-
-            if children:
-                icon = self._get_icon(full_key) if is_key else "📁"
-                node_data = full_key if is_key else None
-                branch = parent.add(f"{icon} {name} ({leaf_count})", data=node_data)
-                if not prefix:
-                    branch.expand()
-                self._build_nodes(branch, children, prefix=full_key)
+    def _build_nodes(self, parent: TreeNode, entries: list[tuple[str, ...]], depth: int, prefix: str) -> None:
+        """Build one tree level from sorted split keys that share *prefix*.
+
+        Only top-level branches are expanded; deeper branches keep their entries in
+        ``_pending_children`` and are populated the first time they are expanded.
+        """
+        for name, group_iter in groupby(entries, key=itemgetter(depth)):
+            self._add_group(parent, name, list(group_iter), depth, prefix)
+
+    def _add_group(
+        self,
+        parent: TreeNode,
+        name: str,
+        group: list[tuple[str, ...]],
+        depth: int,
+        prefix: str,
+        before: TreeNode | None = None,
+    ) -> TreeNode:
+        """Add the node for one *name* at *depth*, whose sorted split keys are *group*."""
+        full_key = f"{prefix}{self.SEPARATOR}{name}" if prefix else name
+        # Sorting puts the key that ends at this level (if any) ahead of its descendants.
+        is_key = len(group[0]) == depth + 1
+        children = group[1:] if is_key else group
+
+        if children:
+            icon = self._get_icon(full_key) if is_key else "📁"
+            node_data = full_key if is_key else None
+            branch = parent.add(f"{icon} {name} ({len(group)})", data=node_data, before=before)
+            if not prefix:
+                branch.expand()
+                self._build_nodes(branch, children, depth + 1, full_key)
             else:
-                icon = self._get_icon(full_key)
-                selected_prefix = "☑ " if full_key in self._selected_keys else ""
-                ttl_suffix = self._get_ttl_suffix(full_key)
-                parent.add_leaf(f"{selected_prefix}{icon} {name}{ttl_suffix}", data=full_key)
+                self._pending_children[branch.id] = (children, depth + 1, full_key)
+            return branch
+
+        icon = self._get_icon(full_key)
+        selected_prefix = "☑ " if full_key in self._selected_keys else ""
+        ttl_suffix = self._get_ttl_suffix(full_key)
+        return parent.add_leaf(f"{selected_prefix}{icon} {name}{ttl_suffix}", data=full_key, before=before)
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        """Populate a lazily built branch the first time it is expanded, and ask for missing key types."""
+        pending = self._pending_children.pop(event.node.id, None)
+        if pending is not None:
+            self._build_nodes(event.node, *pending)
+
+        # Keys listed without types (see MainScreen.KEY_TYPES_PAGE_LIMIT) are typed once they are shown.
+        untyped = [
+            child.data
+            for child in event.node.children
+            if child.data not in (None, "_LOAD_MORE_")
+            and child.data not in self._key_types
+            and child.data not in self._types_requested
+        ]
+        if untyped:
+            self._types_requested.update(untyped)
+            self.post_message(self.TypesRequested(untyped))
+
+    def update_key_types(self, key_types: dict[str, str]) -> None:
+        """Record fetched key types and swap the icons of the nodes already built for them."""
+        self._key_types.update(key_types)
+        unknown = self.TYPE_ICONS["unknown"]
+        stack = list(self.root.children)
+        while stack:
+            node = stack.pop()
+            stack.extend(node.children)
+            if node.data in key_types:
+                node.set_label(str(node.label).replace(unknown, self._get_icon(node.data), 1))
 
     def _get_icon(self, key: str) -> str:
         key_type = self._key_types.get(key, "unknown")
@@ -22,12 +22,23 @@ class ServerInfo(Widget):
     }
     """
 
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._last_info: dict | None = None
+
     def compose(self) -> ComposeResult:
         with VerticalScroll(id="si-content"):
             yield Static("Connect to see server info", id="si-text")
 
     def update_info(self, info: dict):
-        """Update the display with server info data."""
+        """Update the display with server info data.
+
+        Identical snapshots are skipped so repeated refreshes of an idle server
+        do not re-format the panel or trigger a repaint.
+        """
+        if info == self._last_info:
+            return
+        self._last_info = dict(info)
         text_widget = self.query_one("#si-text", Static)
         sections = self._format_info(info)
         text_widget.update(sections)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections import OrderedDict
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
@@ -14,6 +15,8 @@ from textual.widgets import Button, DataTable, Input, Select, Static, TextArea
 class ValueViewer(Widget):
     """Displays and allows editing of Redis key values for all types."""
 
+    JSON_CACHE_SIZE = 64
+
     DEFAULT_CSS = """
     ValueViewer {
         height: 1fr;
@@ -146,6 +149,8 @@ class ValueViewer(Widget):
         self._displayed_count: int = 0   # rows currently shown in the DataTable
         self._hash_cursor: int = 0       # HSCAN cursor; 0 = exhausted
         self._set_cursor: int = 0        # SSCAN cursor; 0 = exhausted
+        # Pretty-printed JSON per string value; None marks values that failed to parse.
+        self._json_cache: OrderedDict[tuple[str, int, int], str | None] = OrderedDict()
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -186,8 +191,14 @@ class ValueViewer(Widget):
         elif value_type == "set":
             self._set_cursor = cursor
 
-        await self.query("*").remove()
+        container = self._build_value_container(key, value_type, data, total_count)
+        # Swap the old content for the new in a single repaint instead of flashing an empty panel.
+        with self.app.batch_update():
+            await self.query("*").remove()
+            await self.mount(container)
 
+    def _build_value_container(self, key: str, value_type: str, data, total_count: int | None) -> Vertical:
+        """Build (but do not mount) the widgets that display a value."""
         type_labels = {"string": "STRING", "list": "LIST", "hash": "HASH", "set": "SET", "zset": "ZSET"}
         type_colors = {"string": "#4CAF50", "list": "#2196F3", "hash": "#FF9800", "set": "#9C27B0", "zset": "#F44336"}
 
@@ -330,7 +341,7 @@ class ValueViewer(Widget):
         else:
             container = Vertical(header, Static(f"Unsupported type: {value_type}", classes="vv-empty"))
 
-        await self.mount(container)
+        return container
 
     # ── Internal Save Helpers ────────────────────────────────────
 
@@ -347,42 +358,43 @@ class ValueViewer(Widget):
         except Exception:
             return
 
-        start = self._displayed_count
-        if self._current_type == "list":
-            for i, val in enumerate(new_data):
-                idx = start + i
-                table.add_row(str(idx), str(val), key=str(idx))
-        elif self._current_type == "zset":
-            for i, (member, score) in enumerate(new_data):
-                rank = start + i + 1
-                table.add_row(str(rank), str(member), str(score), key=f"_r{rank}")
-        elif self._current_type == "hash":
-            for field, val in new_data.items():
-                table.add_row(str(field), str(val), key=str(field))
-            self._hash_cursor = next_cursor
-        elif self._current_type == "set":
-            for i, member in enumerate(new_data):
-                row_num = start + i + 1
-                table.add_row(str(row_num), str(member), key=str(member))
-            self._set_cursor = next_cursor
+        with self.app.batch_update():
+            start = self._displayed_count
+            if self._current_type == "list":
+                for i, val in enumerate(new_data):
+                    idx = start + i
+                    table.add_row(str(idx), str(val), key=str(idx))
+            elif self._current_type == "zset":
+                for i, (member, score) in enumerate(new_data):
+                    rank = start + i + 1
+                    table.add_row(str(rank), str(member), str(score), key=f"_r{rank}")
+            elif self._current_type == "hash":
+                for field, val in new_data.items():
+                    table.add_row(str(field), str(val), key=str(field))
+                self._hash_cursor = next_cursor
+            elif self._current_type == "set":
+                for i, member in enumerate(new_data):
+                    row_num = start + i + 1
+                    table.add_row(str(row_num), str(member), key=str(member))
+                self._set_cursor = next_cursor
 
-        self._displayed_count += len(new_data)
+            self._displayed_count += len(new_data)
 
-        # Update or remove load-more button
-        try:
-            btn = self.query_one("#vv-load-more", Button)
-            exhausted = (
-                self._displayed_count >= total_count
-                or (self._current_type == "hash" and next_cursor == 0)
-                or (self._current_type == "set" and next_cursor == 0)
-            )
-            if exhausted:
-                btn.remove()
-            else:
-                remaining = total_count - self._displayed_count
-                btn.label = f"▾ Load {min(500, remaining):,} more  ({self._displayed_count:,} / {total_count:,})"
-        except Exception:
-            pass
+            # Update or remove load-more button
+            try:
+                btn = self.query_one("#vv-load-more", Button)
+                exhausted = (
+                    self._displayed_count >= total_count
+                    or (self._current_type == "hash" and next_cursor == 0)
+                    or (self._current_type == "set" and next_cursor == 0)
+                )
+                if exhausted:
+                    btn.remove()
+                else:
+                    remaining = total_count - self._displayed_count
+                    btn.label = f"▾ Load {min(500, remaining):,} more  ({self._displayed_count:,} / {total_count:,})"
+            except Exception:
+                pass
 
     def _do_save_list(self) -> None:
         if not self._current_key:
@@ -475,11 +487,11 @@ class ValueViewer(Widget):
             return
         textarea = self.query_one("#vv-text", TextArea)
         if event.value == "json":
-            try:
-                parsed = json.loads(self._current_raw_data)
+            pretty = self._pretty_json(self._current_key or "", self._current_raw_data)
+            if pretty is not None:
                 textarea.language = "json"
-                textarea.text = json.dumps(parsed, indent=2, ensure_ascii=False)
-            except (ValueError, TypeError):
+                textarea.text = pretty
+            else:
                 textarea.language = None
                 textarea.text = str(self._current_raw_data)
                 self.notify("Not valid JSON — showing as Raw", severity="warning", timeout=3)
@@ -487,6 +499,26 @@ class ValueViewer(Widget):
             textarea.language = None
             textarea.text = str(self._current_raw_data)
 
+    def _pretty_json(self, key: str, raw) -> str | None:
+        """Return *raw* re-indented as JSON, or None if it does not parse.
+
+        Results are kept in a small LRU so toggling Raw/JSON on the same value
+        does not re-parse and re-serialize it each time.
+        """
+        text = str(raw)
+        cache_key = (key, len(text), hash(text))
+        if cache_key in self._json_cache:
+            self._json_cache.move_to_end(cache_key)
+            return self._json_cache[cache_key]
+        try:
+            pretty = json.dumps(json.loads(raw), indent=2, ensure_ascii=False)
+        except (ValueError, TypeError):
+            pretty = None
+        self._json_cache[cache_key] = pretty
+        if len(self._json_cache) > self.JSON_CACHE_SIZE:
+            self._json_cache.popitem(last=False)
+        return pretty
+
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Allow pressing Enter in any input field to trigger the save action."""
         if not self._current_key: